@@ -1,60 +1,96 @@
-from fastapi import Depends, HTTPException, status, Request
+import hashlib
+import logging
+import threading
+import time
+from functools import lru_cache
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from database import get_db
-from models.user import User, UserRole
+from models import User, UserRole
 from auth.jwt import verify_token
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
+logger = logging.getLogger(__name__)
 
+# Missing tokens are rejected by get_current_user itself
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login", auto_error=False)
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
+# Columns routes read from current_user; password_hash and timestamps are left unloaded
+_USER_LOAD_OPTIONS = [load_only(User.id, User.email, User.full_name, User.role)]
+
+# Verified tokens: sha256(token) -> (user_id, exp). Entries never outlive the token's own exp.
+_TOKEN_CACHE = TTLCache(maxsize=10_000, ttl=30)
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+async def get_current_user(
+    token: str | None = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ) -> User:
+    if not token:
+        logger.debug("No token provided")
+        # Same response OAuth2PasswordBearer gives with auto_error=True
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    if not token:
-        print(f"❌ No token provided")
-        raise credentials_exception
+    cache_key = hashlib.sha256(token.encode()).digest()
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(cache_key)
 
-    payload = verify_token(token)
-    if payload is None:
-        print(f"❌ Token verification failed: payload is None for token: {token[:20]}...")
-        raise credentials_exception
+    if cached is not None and cached[1] > time.time():
+        user_id = cached[0]
+    else:
+        payload = await run_in_threadpool(verify_token, token)
+        if payload is None:
+            logger.debug("Token verification failed")
+            raise credentials_exception
 
-    user_id = payload.get("sub")
-    if user_id is None:
-        print(f"❌ Token payload missing 'sub'. Payload: {payload}")
-        raise credentials_exception
-    
-    try:
-        user_id = int(user_id)
-    except (ValueError, TypeError) as e:
-        print(f"❌ Failed to convert user_id to int: {user_id}, error: {e}")
-        raise credentials_exception
+        user_id = payload.get("sub")
+        if user_id is None:
+            logger.debug("Token payload missing 'sub'")
+            raise credentials_exception
 
-    user = db.query(User).filter(User.id == user_id).first()
+        try:
+            user_id = int(user_id)
+        except (ValueError, TypeError) as e:
+            logger.debug("Failed to convert user_id to int: %r, error: %s", user_id, e)
+            raise credentials_exception
+
+        exp = payload.get("exp")
+        if exp is not None:
+            with _TOKEN_CACHE_LOCK:
+                _TOKEN_CACHE[cache_key] = (user_id, exp)
+
+    user = await run_in_threadpool(db.get, User, user_id, options=_USER_LOAD_OPTIONS)
     if user is None:
-        print(f"❌ User not found in database for id: {user_id}")
+        logger.debug("User not found in database for id: %s", user_id)
         raise credentials_exception
-
-    print(f"✅ User authenticated: {user.email} (role: {user.role.value})")
     return user
 
 
 def require_role(allowed_roles: list[UserRole]):
-    def role_checker( request: Request, current_user: User = Depends(get_current_user)) -> User:
+    # Same role set -> same checker callable, shared by every route that uses it
+    return _role_checker(frozenset(allowed_roles))
+
 
-        if request.method == "OPTIONS":
-            return None
-         
-        # Compare enum values (current_user.role is UserRole enum, get its string value)
-        if current_user.role.value not in [role.value for role in allowed_roles]:
+@lru_cache(maxsize=None)
+def _role_checker(allowed: frozenset[UserRole]):
+    # CORS preflight (OPTIONS) is answered by CORSMiddleware before routing,
+    # so this never runs for it.
+    def role_checker(current_user: User = Depends(get_current_user)) -> User:
+        # current_user.role is a UserRole member, so compare members directly
+        if current_user.role not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not enough permissions"
@@ -64,8 +100,8 @@ def require_role(allowed_roles: list[UserRole]):
 
 
 def require_admin(current_user: User = Depends(get_current_user)) -> User:
-    # Compare enum value to ensure consistency
-    if current_user.role.value != UserRole.ADMIN.value:
+    # Enum members are singletons, so an identity check is enough
+    if current_user.role is not UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
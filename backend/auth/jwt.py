@@ -1,8 +1,10 @@
+import logging
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from config import settings
 
+logger = logging.getLogger(__name__)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
@@ -23,6 +25,7 @@ def verify_token(token: str) -> Optional[dict]:
         payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
         return payload
     except JWTError as e:
-        print(f"❌ JWT decode error: {type(e).__name__}: {str(e)}")
+        # Lazy %-formatting: nothing is rendered unless DEBUG is on
+        logger.debug("JWT decode error: %s: %s", type(e).__name__, e)
         return None
 
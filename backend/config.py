@@ -10,6 +10,14 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = os.getenv("DB_PASSWORD", "")
     DB_NAME: str = os.getenv("DB_NAME", "career_profiling_db")
     
+    # Connection pool (per worker process)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "False").lower() == "true"
+    # Hand out the most recently used connection first, so hot connections are reused
+    DB_POOL_USE_LIFO: bool = os.getenv("DB_POOL_USE_LIFO", "True").lower() == "true"
+    
     # App
     APP_NAME: str = "Career Profiling Platform"
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
@@ -1,20 +1,38 @@
+import asyncio
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from contextlib import contextmanager
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from config import settings
-from database import engine, Base, SessionLocal
+from sqlalchemy import func, insert, inspect, text, update
+from database import engine, Base, SessionLocal, insert_ignore
 from routes import auth, test_access, test, student_result, counsellor_notes, admin_analytics
+from routes.test import SECTIONS_CONFIG, complete_expired_sections, parse_options_to_array
 import os
+# Import all models to ensure tables are created on startup
 from models import (
-    User, Student, Counsellor, Question, TestAttempt,
-    Answer, Score, InterpretedResult, Career, UserRole, Section,
-    SectionProgress
+    User, Student, Counsellor, Question, QuestionType, TestAttempt,
+    Answer, Score, InterpretedResult, Career, CounsellorNote, UserRole,
+    Section, SectionProgress
 )
-# Import all models to ensure tables are created on startup
-from models.student import Student
-from models.section import Section
-from models.section_progress import SectionProgress
-from models.counsellor_note import CounsellorNote
-from models.question import QuestionType
+
+# Route log records through a queue so request handlers only enqueue them;
+# a background listener thread does the actual stderr writes.
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stderr))
+logging.basicConfig(
+    level=logging.DEBUG if settings.DEBUG else logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -34,105 +52,264 @@ app.add_middleware(
 )
 
 
+# Seed question texts per section, keyed by section order_index
+SECTION_QUESTIONS = {
+    # Intelligence Test questions
+    1: (
+        "I can easily identify patterns in sequences",
+        "I enjoy solving mathematical problems",
+        "I can quickly understand complex instructions",
+        "I am good at logical reasoning",
+        "I can analyze problems from multiple angles",
+        "I enjoy brain teasers and puzzles",
+        "I can think abstractly",
+    ),
+    # Aptitude Test questions
+    2: (
+        "I have strong numerical skills",
+        "I am good at spatial reasoning",
+        "I can quickly learn new skills",
+        "I have good mechanical aptitude",
+        "I am skilled at verbal reasoning",
+        "I can work with my hands effectively",
+        "I have good problem-solving abilities",
+    ),
+    # Study Habits questions
+    3: (
+        "I maintain a consistent study schedule",
+        "I can concentrate for long periods",
+        "I manage my time effectively",
+        "I prepare well for exams",
+        "I have good self-discipline",
+        "I review my notes regularly",
+        "I avoid distractions while studying",
+    ),
+    # Learning Style questions
+    4: (
+        "I learn best by seeing visual aids",
+        "I prefer listening to lectures",
+        "I learn by reading and writing",
+        "I learn best through hands-on activities",
+        "I remember things I see better than things I hear",
+        "I prefer audio recordings over written notes",
+        "I like to take detailed written notes",
+    ),
+    # Career Interest (RIASEC) questions
+    5: (
+        "I enjoy working with tools and machinery",
+        "I like to investigate and research",
+        "I enjoy creative and artistic activities",
+        "I like helping and teaching others",
+        "I enjoy leading and managing projects",
+        "I prefer structured and organized work",
+        "I like working outdoors",
+    ),
+}
+
+# Likert options stored in the canonical JSON form parse_options_to_array reads directly
+LIKERT_OPTIONS = json.dumps([
+    {"key": "A", "text": "Strongly Disagree"},
+    {"key": "B", "text": "Disagree"},
+    {"key": "C", "text": "Neutral"},
+    {"key": "D", "text": "Agree"},
+    {"key": "E", "text": "Strongly Agree"},
+])
+
+# Arbitrary app-wide key for the startup advisory lock
+STARTUP_LOCK_KEY = 510_001
+
+# How often running sections past their time limit are closed in the background
+EXPIRED_SECTION_SWEEP_SECONDS = 30
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def startup_lock():
+    """Serialize schema fixups and seeding across workers booting at the same time."""
+    with engine.connect() as conn:
+        dialect = engine.dialect.name
+        if dialect == "postgresql":
+            conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": STARTUP_LOCK_KEY})
+        elif dialect == "mysql":
+            conn.execute(text("SELECT GET_LOCK(:name, 300)"), {"name": f"startup_{STARTUP_LOCK_KEY}"})
+        try:
+            yield
+        finally:
+            if dialect == "postgresql":
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": STARTUP_LOCK_KEY})
+            elif dialect == "mysql":
+                conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": f"startup_{STARTUP_LOCK_KEY}"})
+
+
 @app.on_event("startup")
 async def startup_event():
-    # 1️⃣ Create tables
-    print("🔵 Creating database tables...")
-    Base.metadata.create_all(bind=engine)
-    print("✅ Database tables created/verified")
-    
-    # Verify students table exists
-    from sqlalchemy import inspect
-    inspector = inspect(engine)
-    tables = inspector.get_table_names()
-    print(f"📊 Existing tables: {tables}")
-    if 'students' in tables:
-        print("✅ students table exists")
-        columns = [col['name'] for col in inspector.get_columns('students')]
-        print(f"   Columns: {columns}")
+    with startup_lock():
+        # 1️⃣ Create tables
+        print("🔵 Creating database tables...")
+        Base.metadata.create_all(bind=engine)
+        print("✅ Database tables created/verified")
+
+        apply_schema_fixups()
+
+        # 2️⃣ Seed admin user and sample questions
+        seed_initial_data()
+
+    app.state.section_sweeper = asyncio.create_task(sweep_expired_sections())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    app.state.section_sweeper.cancel()
+
+
+def run_section_sweep():
+    db = SessionLocal()
+    try:
+        return complete_expired_sections(db)
+    finally:
+        db.close()
+
+
+async def sweep_expired_sections():
+    """Close expired sections every EXPIRED_SECTION_SWEEP_SECONDS; the DB work runs off the event loop."""
+    while True:
+        await asyncio.sleep(EXPIRED_SECTION_SWEEP_SECONDS)
+        try:
+            completed = await run_in_threadpool(run_section_sweep)
+            if completed:
+                logger.info("Auto-completed %d expired section(s)", completed)
+        except Exception:
+            logger.exception("Expired section sweep failed")
+
+
+@contextmanager
+def ddl_step(conn):
+    """Isolate one fixup so a failure doesn't abort the surrounding transaction."""
+    if conn.dialect.name == "mysql":
+        # MySQL commits implicitly after DDL, which would discard a savepoint
+        yield
     else:
-        print("❌ WARNING: students table not found!")
-    
-    # Verify and fix students table structure
-    from sqlalchemy import text, inspect
+        with conn.begin_nested():
+            yield
+
+
+def apply_schema_fixups():
+    """Add columns introduced after the first deploy to existing databases."""
+    # Inspect the schema once and reuse the results below
     inspector = inspect(engine)
-    
-    # Check students table
-    if 'students' in inspector.get_table_names():
-        student_columns = [col['name'] for col in inspector.get_columns('students')]
-        print(f"✅ students table exists with columns: {student_columns}")
-        
-        # Add mobile_number column if missing
-        if 'mobile_number' not in student_columns:
-            print("🔵 Adding mobile_number column to students table...")
-            try:
-                with engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE students ADD COLUMN mobile_number VARCHAR(15) NULL"))
-                    conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ix_students_mobile_number ON students(mobile_number)"))
-                    conn.commit()
-                print("✅ Added mobile_number column")
-            except Exception as e:
-                print(f"⚠️ Could not add mobile_number column: {e}")
-        
-        # Add education column if missing
-        if 'education' not in student_columns:
-            print("🔵 Adding education column to students table...")
-            try:
-                with engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE students ADD COLUMN education VARCHAR(100) NULL"))
-                    conn.commit()
-                print("✅ Added education column")
-            except Exception as e:
-                print(f"⚠️ Could not add education column: {e}")
-    else:
-        print("❌ WARNING: students table does not exist! It should be created by Base.metadata.create_all()")
-    
-    # Add missing correct_answer column if it doesn't exist
-    if 'questions' in inspector.get_table_names():
-        columns = [col['name'] for col in inspector.get_columns('questions')]
-        if 'correct_answer' not in columns:
-            with engine.connect() as conn:
+    tables = set(inspector.get_table_names())
+    print(f"📊 Existing tables: {sorted(tables)}")
+
+    # All fixups share one connection and one transaction
+    with engine.begin() as conn:
+        # Verify and fix students table structure
+        if 'students' in tables:
+            student_columns = [col['name'] for col in inspector.get_columns('students')]
+            print(f"✅ students table exists with columns: {student_columns}")
+
+            # Add mobile_number column if missing
+            if 'mobile_number' not in student_columns:
+                print("🔵 Adding mobile_number column to students table...")
+                try:
+                    with ddl_step(conn):
+                        conn.execute(text("ALTER TABLE students ADD COLUMN mobile_number VARCHAR(15) NULL"))
+                        conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ix_students_mobile_number ON students(mobile_number)"))
+                    print("✅ Added mobile_number column")
+                except Exception as e:
+                    print(f"⚠️ Could not add mobile_number column: {e}")
+
+            # Add education column if missing
+            if 'education' not in student_columns:
+                print("🔵 Adding education column to students table...")
+                try:
+                    with ddl_step(conn):
+                        conn.execute(text("ALTER TABLE students ADD COLUMN education VARCHAR(100) NULL"))
+                    print("✅ Added education column")
+                except Exception as e:
+                    print(f"⚠️ Could not add education column: {e}")
+        else:
+            print("❌ WARNING: students table does not exist! It should be created by Base.metadata.create_all()")
+
+        # Add missing correct_answer column if it doesn't exist
+        if 'questions' in tables:
+            columns = [col['name'] for col in inspector.get_columns('questions')]
+            if 'correct_answer' not in columns:
                 conn.execute(text("ALTER TABLE questions ADD COLUMN correct_answer VARCHAR(10) NULL"))
-                conn.commit()
-            print("✅ Added correct_answer column to questions table")
-        
-        # Add missing section_id column if it doesn't exist
-        if 'section_id' not in columns:
-            print("🔵 Adding section_id column to questions table...")
-            try:
-                with engine.connect() as conn:
-                    # Add the column first
-                    conn.execute(text("ALTER TABLE questions ADD COLUMN section_id INTEGER NULL"))
-                    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_questions_section_id ON questions(section_id)"))
-                    
-                    # Then add foreign key constraint if sections table exists
-                    if 'sections' in inspector.get_table_names():
-                        try:
-                            conn.execute(text("ALTER TABLE questions ADD CONSTRAINT fk_questions_section_id FOREIGN KEY (section_id) REFERENCES sections(id) ON DELETE SET NULL"))
-                        except Exception as fk_error:
-                            # Foreign key might already exist or there might be data issues
-                            error_msg = str(fk_error).lower()
-                            if 'duplicate' in error_msg or 'already exists' in error_msg:
-                                print("ℹ️ Foreign key constraint already exists")
-                            else:
-                                print(f"⚠️ Could not add foreign key constraint: {fk_error}")
-                    
-                    conn.commit()
+                print("✅ Added correct_answer column to questions table")
+
+            # Add missing section_id column if it doesn't exist
+            if 'section_id' not in columns:
+                print("🔵 Adding section_id column to questions table...")
+                try:
+                    with ddl_step(conn):
+                        # Add the column first
+                        conn.execute(text("ALTER TABLE questions ADD COLUMN section_id INTEGER NULL"))
+                        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_questions_section_id ON questions(section_id)"))
+
+                        # Then add foreign key constraint if sections table exists
+                        if 'sections' in tables:
+                            try:
+                                with ddl_step(conn):
+                                    conn.execute(text("ALTER TABLE questions ADD CONSTRAINT fk_questions_section_id FOREIGN KEY (section_id) REFERENCES sections(id) ON DELETE SET NULL"))
+                            except Exception as fk_error:
+                                # Foreign key might already exist or there might be data issues
+                                error_msg = str(fk_error).lower()
+                                if 'duplicate' in error_msg or 'already exists' in error_msg:
+                                    print("ℹ️ Foreign key constraint already exists")
+                                else:
+                                    print(f"⚠️ Could not add foreign key constraint: {fk_error}")
+
                     print("✅ Added section_id column to questions table")
-            except Exception as e:
-                error_msg = str(e).lower()
-                if 'duplicate' in error_msg or 'already exists' in error_msg:
-                    print("ℹ️ section_id column may already exist")
-                else:
-                    print(f"⚠️ Could not add section_id column: {e}")
-    
-    # 2️⃣ Seed admin user and sample questions
+                except Exception as e:
+                    error_msg = str(e).lower()
+                    if 'duplicate' in error_msg or 'already exists' in error_msg:
+                        print("ℹ️ section_id column may already exist")
+                    else:
+                        print(f"⚠️ Could not add section_id column: {e}")
+
+        # create_all() does not add indexes to tables that already exist
+        for table in (
+            Section.__table__, Question.__table__, SectionProgress.__table__,
+            Answer.__table__, TestAttempt.__table__, Score.__table__
+        ):
+            existing_indexes = {ix['name'] for ix in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name in existing_indexes:
+                    continue
+                try:
+                    with ddl_step(conn):
+                        index.create(bind=conn)
+                except Exception as e:
+                    print(f"⚠️ Could not create index {index.name}: {e}")
+
+
+def normalize_question_options(db):
+    """Rewrite legacy "A) ..., B) ..." option strings as canonical JSON arrays."""
+    updates = []
+    for question_id, options in db.query(Question.id, Question.options).filter(Question.options.isnot(None)):
+        parsed = parse_options_to_array(options)
+        if not parsed:
+            # Leave rows the parser cannot read untouched
+            continue
+        canonical = json.dumps([{"key": o.key, "text": o.text} for o in parsed], ensure_ascii=False)
+        if canonical != options:
+            updates.append({"id": question_id, "options": canonical})
+
+    if updates:
+        db.execute(update(Question), updates)
+        db.commit()
+        print(f"✅ Normalized options for {len(updates)} questions")
+
+
+def seed_initial_data():
+    """Idempotently seed the admin user, the 5 sections and their questions."""
     db = SessionLocal()
     try:
         # Seed admin user
-        admin_exists = db.query(User).filter(
+        admin_exists = db.query(User.id).filter(
             User.role == UserRole.ADMIN
-        ).first()
+        ).first() is not None
 
         if not admin_exists:
             admin_user = User(
@@ -148,207 +325,87 @@ async def startup_event():
         else:
             print("ℹ️ Admin already exists")
 
-        # Seed sections if table is empty - EXACTLY 5 sections in mandatory order
-        section_count = db.query(Section).count()
-        if section_count == 0:
-            sections = [
-                Section(
-                    name="Section 1: Intelligence Test (Cognitive Reasoning)",
-                    description="Logical Reasoning, Numerical Reasoning, Verbal Reasoning, Abstract Reasoning",
-                    order_index=1,
-                    is_active=True
-                ),
-                Section(
-                    name="Section 2: Aptitude Test",
-                    description="Numerical Aptitude, Logical Aptitude, Verbal Aptitude, Spatial/Mechanical Aptitude",
-                    order_index=2,
-                    is_active=True
-                ),
-                Section(
-                    name="Section 3: Study Habits",
-                    description="Concentration, Consistency, Time Management, Exam Preparedness, Self-discipline",
-                    order_index=3,
-                    is_active=True
-                ),
-                Section(
-                    name="Section 4: Learning Style",
-                    description="Visual, Auditory, Reading/Writing, Kinesthetic",
-                    order_index=4,
-                    is_active=True
-                ),
-                Section(
-                    name="Section 5: Career Interest (RIASEC)",
-                    description="Realistic, Investigative, Artistic, Social, Enterprising, Conventional",
-                    order_index=5,
-                    is_active=True
-                )
-            ]
-            for s in sections:
-                db.add(s)
-            db.commit()
-            print(f"✅ Created {len(sections)} sections")
+        # Seed sections - EXACTLY 5 sections in mandatory order; existing ones are skipped
+        result = db.execute(
+            insert_ignore(Section),
+            [{**config, "is_active": True} for config in SECTIONS_CONFIG]
+        )
+        db.commit()
+        if result.rowcount > 0:
+            print(f"✅ Created {result.rowcount} missing sections")
         else:
-            # Ensure all 5 sections exist - create missing ones
-            existing_sections = db.query(Section).order_by(Section.order_index).all()
-            existing_order_indices = {s.order_index for s in existing_sections}
-            
-            # Define all 5 sections
-            all_sections_config = [
-                {"order_index": 1, "name": "Section 1: Intelligence Test (Cognitive Reasoning)", "description": "Logical Reasoning, Numerical Reasoning, Verbal Reasoning, Abstract Reasoning"},
-                {"order_index": 2, "name": "Section 2: Aptitude Test", "description": "Numerical Aptitude, Logical Aptitude, Verbal Aptitude, Spatial/Mechanical Aptitude"},
-                {"order_index": 3, "name": "Section 3: Study Habits", "description": "Concentration, Consistency, Time Management, Exam Preparedness, Self-discipline"},
-                {"order_index": 4, "name": "Section 4: Learning Style", "description": "Visual, Auditory, Reading/Writing, Kinesthetic"},
-                {"order_index": 5, "name": "Section 5: Career Interest (RIASEC)", "description": "Realistic, Investigative, Artistic, Social, Enterprising, Conventional"}
-            ]
-            
-            # Create missing sections
-            sections_to_create = []
-            for config in all_sections_config:
-                if config["order_index"] not in existing_order_indices:
-                    sections_to_create.append(Section(
-                        name=config["name"],
-                        description=config["description"],
-                        order_index=config["order_index"],
-                        is_active=True
-                    ))
-            
-            if sections_to_create:
-                for s in sections_to_create:
-                    db.add(s)
-                db.commit()
-                print(f"✅ Created {len(sections_to_create)} missing sections")
-                # Refresh to get newly created sections with their IDs
-                db.expire_all()
-            else:
-                print(f"ℹ️ All 5 sections already exist")
-        
+            print(f"ℹ️ All 5 sections already exist")
+
         # Seed questions - ensure each section has exactly 7 questions
-        # Get all sections (refresh to include newly created ones)
         all_sections = db.query(Section).order_by(Section.order_index).all()
         print(f"🔵 Total sections in database: {len(all_sections)}")
         for s in all_sections:
             print(f"  - Section {s.order_index}: {s.name} (ID: {s.id})")
-        
+
         # Ensure we have all 5 sections before creating questions
         if len(all_sections) < 5:
             print(f"⚠️ WARNING: Only {len(all_sections)} sections found, expected 5. Some sections may be missing.")
-        
-        # Check each section and ensure it has 7 questions
+
+        # Active question count per section in one query
+        question_counts = dict(
+            db.query(Question.section_id, func.count(Question.id))
+            .filter(Question.is_active == True)
+            .group_by(Question.section_id)
+            .all()
+        )
+
+        new_questions = []
         for section in all_sections:
-            print(f"🔵 Checking Section {section.order_index} ({section.name}) for questions...")
-            section_question_count = db.query(Question).filter(
-                Question.section_id == section.id,
-                Question.is_active == True
-            ).count()
-            
-            if section_question_count < 7:
-                # Need to create questions for this section
-                questions_to_create = 7 - section_question_count
-                print(f"🔵 Section {section.order_index} ({section.name}) has {section_question_count} questions. Creating {questions_to_create} more...")
-                
-                # Generate questions based on section type
-                new_questions = []
-                for i in range(questions_to_create):
-                    question_num = section_question_count + i + 1
-                    
-                    # Generate question text based on section
-                    if section.order_index == 1:
-                        # Intelligence Test questions
-                        question_texts = [
-                            "I can easily identify patterns in sequences",
-                            "I enjoy solving mathematical problems",
-                            "I can quickly understand complex instructions",
-                            "I am good at logical reasoning",
-                            "I can analyze problems from multiple angles",
-                            "I enjoy brain teasers and puzzles",
-                            "I can think abstractly"
-                        ]
-                    elif section.order_index == 2:
-                        # Aptitude Test questions
-                        question_texts = [
-                            "I have strong numerical skills",
-                            "I am good at spatial reasoning",
-                            "I can quickly learn new skills",
-                            "I have good mechanical aptitude",
-                            "I am skilled at verbal reasoning",
-                            "I can work with my hands effectively",
-                            "I have good problem-solving abilities"
-                        ]
-                    elif section.order_index == 3:
-                        # Study Habits questions
-                        question_texts = [
-                            "I maintain a consistent study schedule",
-                            "I can concentrate for long periods",
-                            "I manage my time effectively",
-                            "I prepare well for exams",
-                            "I have good self-discipline",
-                            "I review my notes regularly",
-                            "I avoid distractions while studying"
-                        ]
-                    elif section.order_index == 4:
-                        # Learning Style questions
-                        question_texts = [
-                            "I learn best by seeing visual aids",
-                            "I prefer listening to lectures",
-                            "I learn by reading and writing",
-                            "I learn best through hands-on activities",
-                            "I remember things I see better than things I hear",
-                            "I prefer audio recordings over written notes",
-                            "I like to take detailed written notes"
-                        ]
-                    else:  # section.order_index == 5
-                        # Career Interest (RIASEC) questions
-                        question_texts = [
-                            "I enjoy working with tools and machinery",
-                            "I like to investigate and research",
-                            "I enjoy creative and artistic activities",
-                            "I like helping and teaching others",
-                            "I enjoy leading and managing projects",
-                            "I prefer structured and organized work",
-                            "I like working outdoors"
-                        ]
-                    
-                    # Use question text from list, or generate generic one
-                    if question_num <= len(question_texts):
-                        question_text = question_texts[question_num - 1]
-                    else:
-                        question_text = f"Question {question_num} for {section.name}"
-                    
-                    new_questions.append(Question(
-                        question_text=question_text,
-                        question_type=QuestionType.MULTIPLE_CHOICE,
-                        options="A) Strongly Disagree, B) Disagree, C) Neutral, D) Agree, E) Strongly Agree",
-                        correct_answer="C",  # Default neutral answer
-                        category=f"section_{section.order_index}",
-                        section_id=section.id,
-                        is_active=True,
-                        order_index=question_num
-                    ))
-                
-                # Add all new questions
-                for q in new_questions:
-                    db.add(q)
-                db.commit()
-                print(f"✅ Created {len(new_questions)} questions for Section {section.order_index}")
-        
+            section_question_count = question_counts.get(section.id, 0)
+            if section_question_count >= 7:
+                continue
+
+            questions_to_create = 7 - section_question_count
+            print(f"🔵 Section {section.order_index} ({section.name}) has {section_question_count} questions. Creating {questions_to_create} more...")
+            question_counts[section.id] = 7
+
+            # Section 5 texts also cover any unexpected order_index
+            question_texts = SECTION_QUESTIONS.get(section.order_index, SECTION_QUESTIONS[5])
+
+            for i in range(questions_to_create):
+                question_num = section_question_count + i + 1
+
+                # Use question text from list, or generate generic one
+                if question_num <= len(question_texts):
+                    question_text = question_texts[question_num - 1]
+                else:
+                    question_text = f"Question {question_num} for {section.name}"
+
+                new_questions.append({
+                    "question_text": question_text,
+                    "question_type": QuestionType.MULTIPLE_CHOICE,
+                    "options": LIKERT_OPTIONS,
+                    "correct_answer": "C",  # Default neutral answer
+                    "category": f"section_{section.order_index}",
+                    "section_id": section.id,
+                    "is_active": True,
+                    "order_index": question_num,
+                })
+
+        # Insert all missing questions in one statement
+        if new_questions:
+            db.execute(insert(Question), new_questions)
+            db.commit()
+            print(f"✅ Created {len(new_questions)} questions")
+
+        normalize_question_options(db)
+
         # Final verification - ensure sections 4 and 5 exist and have questions
-        section4 = db.query(Section).filter(Section.order_index == 4).first()
-        section5 = db.query(Section).filter(Section.order_index == 5).first()
-        
-        if section4:
-            section4_questions = db.query(Question).filter(Question.section_id == section4.id, Question.is_active == True).count()
-            print(f"✅ Section 4: {section4_questions}/7 questions")
-        else:
-            print(f"❌ ERROR: Section 4 not found in database!")
-        
-        if section5:
-            section5_questions = db.query(Question).filter(Question.section_id == section5.id, Question.is_active == True).count()
-            print(f"✅ Section 5: {section5_questions}/7 questions")
-        else:
-            print(f"❌ ERROR: Section 5 not found in database!")
-        
+        sections_by_order = {s.order_index: s for s in all_sections}
+        for order_index in (4, 5):
+            section = sections_by_order.get(order_index)
+            if section:
+                print(f"✅ Section {order_index}: {question_counts.get(section.id, 0)}/7 questions")
+            else:
+                print(f"❌ ERROR: Section {order_index} not found in database!")
+
         # Final check
-        total_questions = db.query(Question).count()
+        total_questions = db.query(func.count(Question.id)).scalar()
         print(f"ℹ️ Total questions in database: {total_questions}")
 
     except Exception as e:
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Text, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, Text, DateTime, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from database import Base
@@ -6,9 +6,14 @@ from database import Base
 
 class Answer(Base):
     __tablename__ = "answers"
+    __table_args__ = (
+        # One answer per question per attempt
+        Index("ix_answers_attempt_question", "test_attempt_id", "question_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    test_attempt_id = Column(Integer, ForeignKey("test_attempts.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Indexed through ix_answers_attempt_question, which leads with this column
+    test_attempt_id = Column(Integer, ForeignKey("test_attempts.id", ondelete="CASCADE"), nullable=False)
     question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"), nullable=False, index=True)
     answer_text = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
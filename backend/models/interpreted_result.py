@@ -17,5 +17,5 @@ class InterpretedResult(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     test_attempt = relationship("TestAttempt", back_populates="interpreted_result")
-    careers = relationship("Career", back_populates="interpreted_result", cascade="all, delete-orphan")
+    careers = relationship("Career", back_populates="interpreted_result", cascade="all, delete-orphan", order_by="Career.order_index")
 
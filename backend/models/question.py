@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Enum, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Enum, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -13,6 +13,10 @@ class QuestionType(str, enum.Enum):
 
 class Question(Base):
     __tablename__ = "questions"
+    __table_args__ = (
+        Index("ix_questions_section_active", "section_id", "is_active"),
+        Index("ix_questions_active_order", "is_active", "order_index"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     question_text = Column(Text, nullable=False)
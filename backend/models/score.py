@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, String, Float, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, String, Float, DateTime, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from database import Base
@@ -6,6 +6,10 @@ from database import Base
 
 class Score(Base):
     __tablename__ = "scores"
+    __table_args__ = (
+        # Overall / per-section score lookups per attempt
+        Index("ix_scores_attempt_dimension", "test_attempt_id", "dimension"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     test_attempt_id = Column(Integer, ForeignKey("test_attempts.id", ondelete="CASCADE"), nullable=False, index=True)
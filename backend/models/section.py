@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from database import Base
@@ -6,6 +6,12 @@ from database import Base
 
 class Section(Base):
     __tablename__ = "sections"
+    __table_args__ = (
+        # Section seeding relies on this to skip sections that already exist
+        Index("ix_sections_order_index", "order_index", unique=True),
+        # Active sections listed in order
+        Index("ix_sections_active_order", "is_active", "order_index"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False, unique=True)  # e.g., "Section 1: Logical Reasoning"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum, String
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum, String, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -13,9 +13,16 @@ class SectionStatus(str, enum.Enum):
 
 class SectionProgress(Base):
     __tablename__ = "section_progresses"
+    __table_args__ = (
+        # One progress row per section per attempt
+        Index("ix_sp_attempt_section", "test_attempt_id", "section_id", unique=True),
+        # Completed-section lookups per attempt
+        Index("ix_sp_attempt_status", "test_attempt_id", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    test_attempt_id = Column(Integer, ForeignKey("test_attempts.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Indexed through the composite indexes above, which lead with this column
+    test_attempt_id = Column(Integer, ForeignKey("test_attempts.id", ondelete="CASCADE"), nullable=False)
     section_id = Column(Integer, ForeignKey("sections.id", ondelete="CASCADE"), nullable=False, index=True)
     status = Column(Enum(SectionStatus), default=SectionStatus.NOT_STARTED, nullable=False)
     
@@ -32,21 +32,21 @@ def calculate_readiness_status(percentage: float) -> str:
 
 
 @router.get("", response_model=AnalyticsResponse)
-async def get_analytics(
+def get_analytics(
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Get admin analytics (Admin only)"""
     
     # Count users by role
-    total_students = db.query(User).filter(User.role == UserRole.STUDENT).count()
-    total_counsellors = db.query(User).filter(User.role == UserRole.COUNSELLOR).count()
+    total_students = db.query(func.count(User.id)).filter(User.role == UserRole.STUDENT).scalar()
+    total_counsellors = db.query(func.count(User.id)).filter(User.role == UserRole.COUNSELLOR).scalar()
     
     # Count test attempts
-    total_attempts = db.query(TestAttempt).count()
-    completed_attempts = db.query(TestAttempt).filter(
+    total_attempts = db.query(func.count(TestAttempt.id)).scalar()
+    completed_attempts = db.query(func.count(TestAttempt.id)).filter(
         TestAttempt.status == TestStatus.COMPLETED
-    ).count()
+    ).scalar()
     
     # Calculate average score
     avg_score_result = db.query(func.avg(Score.score_value)).filter(
@@ -5,8 +5,7 @@ from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr, validator
 from passlib.context import CryptContext
 from database import get_db, engine
-from models.user import User, UserRole
-from models.student import Student
+from models import User, UserRole, Student
 from auth.jwt import create_access_token
 from auth.dependencies import get_current_user, require_admin
 from config import settings
@@ -72,7 +71,7 @@ class TokenResponse(BaseModel):
 
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserRegister, db: Session = Depends(get_db)):
+def register(user_data: UserRegister, db: Session = Depends(get_db)):
     """Student self-registration - ATOMIC: Creates User and Student in single transaction"""
     print(f"\n{'='*50}")
     print(f"🔵 REGISTRATION REQUEST RECEIVED")
@@ -165,7 +164,7 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(
+def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
@@ -219,7 +218,7 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 
 
 @router.post("/create-user", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def create_user(
+def create_user(
     user_data: UserCreate,
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin)
@@ -32,7 +32,7 @@ class NoteResponse(BaseModel):
 
 
 @router.post("", response_model=NoteResponse, status_code=status.HTTP_201_CREATED)
-async def create_or_update_note(
+def create_or_update_note(
     note_data: NoteCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_counsellor)
@@ -99,7 +99,7 @@ async def create_or_update_note(
 
 
 @router.get("/{test_attempt_id}", response_model=Optional[NoteResponse])
-async def get_note(
+def get_note(
     test_attempt_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
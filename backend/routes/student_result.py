@@ -38,7 +38,7 @@ class ResultResponse(BaseModel):
 
 
 @router.get("/{test_attempt_id}", response_model=ResultResponse)
-async def get_result(
+def get_result(
     test_attempt_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_student)
@@ -94,7 +94,7 @@ async def get_result(
 
 
 @router.get("/", response_model=List[ResultResponse])
-async def get_all_results(
+def get_all_results(
     db: Session = Depends(get_db),
     current_user: User = Depends(require_student)
 ):
@@ -1,29 +1,147 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from pydantic import BaseModel
-from typing import List, Optional, Dict
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Integer, and_, bindparam, case, distinct, exists, func, insert, or_, select, update
+from sqlalchemy.orm import Session, selectinload
+from pydantic import BaseModel, TypeAdapter
+from typing import List, Optional, Dict, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from cachetools import TTLCache, cached
 from datetime import datetime, timezone
+import hashlib
 import json
+import logging
+import orjson
 import re
-from database import get_db
+import threading
+from database import get_db, insert_ignore
 from models import (
-    User, UserRole, Question, TestAttempt, TestStatus,
+    User, UserRole, Student, Question, TestAttempt, TestStatus,
     Answer, Score, InterpretedResult, Section, SectionProgress, SectionStatus
 )
-from auth.dependencies import get_current_user, require_role
+from auth.dependencies import get_current_user, require_admin, require_role
 from services.scoring import store_scores
 from services.gemini_interpreter import generate_and_save_interpretation
 
-router = APIRouter(prefix="/test", tags=["test"])
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/test", tags=["test"], default_response_class=ORJSONResponse)
 
 # Test configuration constants
 TOTAL_QUESTIONS = 35  # Total questions across all sections (7 questions × 5 sections)
 QUESTIONS_PER_SECTION = 7  # Questions per section
 TOTAL_SECTIONS = 5  # Total number of sections
+SECTION_TIME_LIMIT = 420  # 7 minutes (420 seconds) per section
+
+# The 5 mandatory sections, in order. Seeded at startup and used as placeholders
+# by get_sections for any section missing from the database.
+SECTIONS_CONFIG = [
+    {"order_index": 1, "name": "Section 1: Intelligence Test (Cognitive Reasoning)", "description": "Logical Reasoning, Numerical Reasoning, Verbal Reasoning, Abstract Reasoning"},
+    {"order_index": 2, "name": "Section 2: Aptitude Test", "description": "Numerical Aptitude, Logical Aptitude, Verbal Aptitude, Spatial/Mechanical Aptitude"},
+    {"order_index": 3, "name": "Section 3: Study Habits", "description": "Concentration, Consistency, Time Management, Exam Preparedness, Self-discipline"},
+    {"order_index": 4, "name": "Section 4: Learning Style", "description": "Visual, Auditory, Reading/Writing, Kinesthetic"},
+    {"order_index": 5, "name": "Section 5: Career Interest (RIASEC)", "description": "Realistic, Investigative, Artistic, Social, Enterprising, Conventional"}
+]
+
+
+@dataclass(frozen=True, slots=True)
+class TempSection:
+    """Stand-in for a Section row that is missing from the database."""
+    id: int  # order_index doubles as the ID
+    name: str
+    description: str
+    order_index: int
+    is_active: bool = True
+
+
+TEMP_SECTIONS = {
+    config["order_index"]: TempSection(
+        id=config["order_index"],
+        name=config["name"],
+        description=config["description"],
+        order_index=config["order_index"]
+    )
+    for config in SECTIONS_CONFIG
+}
 
 require_student = require_role([UserRole.STUDENT])
 require_student_or_counsellor = require_role([UserRole.STUDENT, UserRole.COUNSELLOR])
 
+# Active question/section counts only change when content is edited, so cache them briefly per process
+ACTIVE_COUNT_TTL = 60  # seconds
+
+
+@cached(cache=TTLCache(maxsize=1, ttl=ACTIVE_COUNT_TTL), key=lambda db: "questions", lock=threading.Lock())
+def get_active_question_count(db: Session) -> int:
+    return db.query(func.count(Question.id)).filter(Question.is_active == True).scalar()
+
+
+@cached(cache=TTLCache(maxsize=1, ttl=ACTIVE_COUNT_TTL), key=lambda db: "sections", lock=threading.Lock())
+def get_active_section_count(db: Session) -> int:
+    return db.query(func.count(Section.id)).filter(Section.is_active == True).scalar()
+
+
+@cached(cache=TTLCache(maxsize=1, ttl=ACTIVE_COUNT_TTL), key=lambda db: "section_names", lock=threading.Lock())
+def get_section_names(db: Session) -> Dict[int, str]:
+    # order_index -> name for every section; shared between callers, so treat as read-only
+    return dict(db.query(Section.order_index, Section.name).all())
+
+
+def clear_content_caches() -> None:
+    """Drop the cached question/section counts, section names and completed-student
+    section listings after content is edited."""
+    get_active_question_count.cache_clear()
+    get_active_section_count.cache_clear()
+    get_section_names.cache_clear()
+    with _SECTIONS_DONE_LOCK:
+        _SECTIONS_DONE_CACHE.clear()
+
+
+# Completed attempt id per student. A completed attempt never changes (one attempt only),
+# so only hits are cached; students without one are always re-checked against the DB.
+_COMPLETED_ATTEMPT_CACHE = TTLCache(maxsize=10_000, ttl=60)
+_COMPLETED_ATTEMPT_LOCK = threading.Lock()
+
+
+def get_completed_attempt_id(db: Session, student_id: int) -> Optional[int]:
+    with _COMPLETED_ATTEMPT_LOCK:
+        attempt_id = _COMPLETED_ATTEMPT_CACHE.get(student_id)
+    if attempt_id is not None:
+        return attempt_id
+
+    # Most recent completed attempt
+    attempt_id = db.query(TestAttempt.id).filter(
+        TestAttempt.student_id == student_id,
+        TestAttempt.status == TestStatus.COMPLETED
+    ).order_by(TestAttempt.completed_at.desc()).limit(1).scalar()
+    if attempt_id is not None:
+        remember_completed_attempt(student_id, attempt_id)
+    return attempt_id
+
+
+def remember_completed_attempt(student_id: int, attempt_id: int) -> None:
+    with _COMPLETED_ATTEMPT_LOCK:
+        _COMPLETED_ATTEMPT_CACHE[student_id] = attempt_id
+
+
+# Serialized /sections body per (student_id, completed_attempt_id). The TTL only bounds
+# staleness after section content edits; the listing itself is frozen post-completion.
+_SECTIONS_DONE_CACHE = TTLCache(maxsize=10_000, ttl=300)
+_SECTIONS_DONE_LOCK = threading.Lock()
+
+# Timer state per (attempt_id, section_id as requested). Timer polls arrive about once a
+# second per running section; within the TTL current_time is recomputed from the cached
+# start time instead of re-reading the row. Writers drop the entry via forget_section_timer.
+_TIMER_CACHE = TTLCache(maxsize=10_000, ttl=0.5)
+_TIMER_LOCK = threading.Lock()
+
+
+def forget_section_timer(attempt_id: int, section_db_id: int, order_index: int) -> None:
+    # The timer may have been requested by database ID or by order_index
+    with _TIMER_LOCK:
+        _TIMER_CACHE.pop((attempt_id, section_db_id), None)
+        _TIMER_CACHE.pop((attempt_id, order_index), None)
+
 
 class OptionItem(BaseModel):
     key: str
@@ -39,6 +157,35 @@ class QuestionResponse(BaseModel):
         from_attributes = True
 
 
+# Option parsing patterns, compiled once
+_OPTION_ITEM_RE = re.compile(r'^([A-E])[\)\.]\s*(.+)$', re.IGNORECASE)  # "A) Text"
+_OPTION_PERMISSIVE_RE = re.compile(r'([A-E])[\)\.]\s*([^,]+?)(?=\s*[A-E][\)\.]|$)', re.IGNORECASE)
+
+# Parses the JSON option form with pydantic-core's parser (faster than json.loads)
+_OPTION_LIST_ADAPTER = TypeAdapter(list)
+
+
+def _split_option_parts(options_string: str) -> List[str]:
+    """
+    Split on each comma (plus following whitespace) that directly precedes an
+    option marker such as "B)" or "C.". Single left-to-right scan, no regex.
+    """
+    parts = []
+    start = 0
+    n = len(options_string)
+    comma = options_string.find(',')
+    while comma != -1:
+        j = comma + 1
+        while j < n and options_string[j].isspace():
+            j += 1
+        if j + 1 < n and options_string[j] in 'ABCDE' and options_string[j + 1] in ').':
+            parts.append(options_string[start:comma])
+            start = j
+        comma = options_string.find(',', j)
+    parts.append(options_string[start:])
+    return parts
+
+
 def parse_options_to_array(options_string: Optional[str]) -> List[OptionItem]:
     """
     Parse options string to array format.
@@ -49,65 +196,65 @@ def parse_options_to_array(options_string: Optional[str]) -> List[OptionItem]:
     """
     if not options_string:
         return []
-    
-    # Try to parse as JSON first
-    try:
-        parsed = json.loads(options_string)
-        if isinstance(parsed, list):
-            # If it's already a list, convert to OptionItem format
-            result = []
-            for item in parsed:  # Process all items (can be 4 or 5)
-                if isinstance(item, dict):
-                    key = item.get('key', item.get('value', ''))
-                    text = item.get('text', item.get('label', ''))
-                    if key and text:
-                        result.append(OptionItem(key=str(key).upper(), text=str(text).strip()))
-                elif isinstance(item, str):
-                    # Handle string items like "A) Text"
-                    match = re.match(r'^([A-E])[\)\.]\s*(.+)$', item.strip(), re.IGNORECASE)
-                    if match:
-                        result.append(OptionItem(key=match.group(1).upper(), text=match.group(2).strip()))
-            return result  # Return all parsed options
-    except (json.JSONDecodeError, ValueError):
-        pass
+    return list(_parse_options_cached(options_string))
+
+
+@lru_cache(maxsize=256)
+def _parse_options_cached(options_string: str) -> Tuple[OptionItem, ...]:
+    # Question options are static, so each distinct string is parsed once.
+    # Keys and texts are plain strings built right here, so items skip validation.
+    # A tuple keeps the cached value immutable; callers get a fresh list.
+    # Try to parse as JSON first; only a JSON array can yield options, so plain
+    # "A) ..." strings skip the parse attempt (and its exception) entirely
+    if options_string.lstrip()[:1] == '[':
+        try:
+            parsed = _OPTION_LIST_ADAPTER.validate_json(options_string)
+            if isinstance(parsed, list):
+                # If it's already a list, convert to OptionItem format
+                result = []
+                for item in parsed:  # Process all items (can be 4 or 5)
+                    if isinstance(item, dict):
+                        key = item.get('key', item.get('value', ''))
+                        text = item.get('text', item.get('label', ''))
+                        if key and text:
+                            result.append(OptionItem.model_construct(key=str(key).upper(), text=str(text).strip()))
+                    elif isinstance(item, str):
+                        # Handle string items like "A) Text"
+                        match = _OPTION_ITEM_RE.match(item.strip())
+                        if match:
+                            result.append(OptionItem.model_construct(key=match.group(1).upper(), text=match.group(2).strip()))
+                return tuple(result)  # Return all parsed options
+        except (json.JSONDecodeError, ValueError):
+            pass
     
     # Parse string format like "A) Strongly Disagree, B) Disagree, C) Neutral, D) Agree, E) Strongly Agree"
     result = []
     
-    # Split by comma, but be smart about it - look for pattern ", A)", ", B)", etc.
+    # Split by comma, but be smart about it - only at ", A)", ", B)", etc.
     # This handles cases where option text might contain commas
-    parts = re.split(r',\s*(?=[A-E][\)\.])', options_string)
-    
-    # Parse each part with pattern: ^([A-E])[\)\.]\s*(.+)$
-    option_pattern = re.compile(r'^([A-E])[\)\.]\s*(.+)$', re.IGNORECASE)
-    
-    for part in parts:
+    for part in _split_option_parts(options_string):
         trimmed_part = part.strip()
-        if not trimmed_part:
+        # "A) Text" / "a. Text"; text must stay on one line
+        if len(trimmed_part) < 3 or trimmed_part[0] not in 'ABCDEabcde' or trimmed_part[1] not in ').':
             continue
-        
-        match = option_pattern.match(trimmed_part)
-        if match:
-            key = match.group(1).upper()
-            text = match.group(2).strip()
-            if key and text:
-                result.append(OptionItem(key=key, text=text))
+        text = trimmed_part[2:].lstrip()
+        if text and '\n' not in text:
+            result.append(OptionItem.model_construct(key=trimmed_part[0].upper(), text=text))
     
     # If no options were parsed with the above method, try alternative parsing
     if len(result) == 0:
         # Try a more permissive regex that matches anywhere in the string
-        pattern = r'([A-E])[\)\.]\s*([^,]+?)(?=\s*[A-E][\)\.]|$)'
-        matches = re.finditer(pattern, options_string, re.IGNORECASE)
+        matches = _OPTION_PERMISSIVE_RE.finditer(options_string)
         
         for match in matches:
             key = match.group(1).upper()
             text = match.group(2).strip()
             if key and text:
-                result.append(OptionItem(key=key, text=text))
+                result.append(OptionItem.model_construct(key=key, text=text))
     
     # Return all parsed options (can be 4 for MCQ or 5 for Likert scale)
     # Do NOT create placeholder options - if parsing fails, return empty array
-    return result
+    return tuple(result)
 
 
 class TestStartResponse(BaseModel):
@@ -171,81 +318,123 @@ class TestStatusResponse(BaseModel):
         from_attributes = True
 
 
-@router.get("/questions", response_model=List[QuestionResponse])
-async def get_questions(
+def etag_json_response(request: Request, payload, cache_control: str) -> Response:
+    """
+    Serialize payload with orjson and tag it with an ETag of the body. A matching
+    If-None-Match gets an empty 304 instead of the body.
+    """
+    return etag_body_response(request, orjson.dumps(payload), cache_control)
+
+
+def etag_body_response(request: Request, body: bytes, cache_control: str) -> Response:
+    """etag_json_response for an already-serialized JSON body."""
+    etag = f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def question_payload(questions) -> List[dict]:
+    """
+    QuestionResponse-shaped dicts for (id, question_text, options) rows. Rows come
+    straight from our own table and parser, so the payload skips FastAPI's
+    response-model validation pass.
+    """
+    return [
+        {
+            "question_id": q.id,
+            "question_text": q.question_text,
+            "options": [
+                {"key": option.key, "text": option.text}
+                for option in parse_options_to_array(q.options)
+            ]
+        }
+        for q in questions
+    ]
+
+
+@router.get(
+    "/questions",
+    response_model=None,
+    responses={200: {"model": List[QuestionResponse]}}
+)
+def get_questions(
     db: Session = Depends(get_db),
     current_user: User = Depends(require_student)
 ):
     """Get all active questions for the test (student only, no correct answers)"""
     try:
-        questions = db.query(Question).filter(
+        # Only the columns the response needs, as plain rows
+        questions = db.query(Question.id, Question.question_text, Question.options).filter(
             Question.is_active == True
         ).order_by(Question.order_index).all()
         
-        return [
-            QuestionResponse(
-                question_id=q.id,
-                question_text=q.question_text,
-                options=parse_options_to_array(q.options)
-            )
-            for q in questions
-        ]
+        return ORJSONResponse(question_payload(questions))
     except Exception as e:
-        import traceback
-        print(f"❌ Error in get_questions: {type(e).__name__}: {e}")
-        traceback.print_exc()
+        logger.exception("Error in get_questions: %s: %s", type(e).__name__, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch questions: {str(e)}"
         )
 
 
+@router.post("/admin/clear-cache", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+def clear_cache(current_user: User = Depends(require_admin)):
+    """Drop cached question/section counts after sections or questions are edited (admin only)"""
+    clear_content_caches()
+
+
 @router.post("/start", response_model=TestStartResponse, status_code=status.HTTP_200_OK)
-async def start_test(
+def start_test(
     db: Session = Depends(get_db),
     current_user: User = Depends(require_student)
 ):
     """Start a new test attempt or return existing in-progress attempt"""
-    # Ensure student profile exists
-    from models.student import Student
-    student_profile = db.query(Student).filter(Student.user_id == current_user.id).first()
+    # Student profile plus any completed / in-progress attempts, in one round-trip.
+    # The status filter sits in the ON clause so a profile without attempts still yields a row.
+    rows = db.query(
+        Student.id, TestAttempt.id, TestAttempt.status, TestAttempt.started_at
+    ).outerjoin(
+        TestAttempt,
+        and_(
+            TestAttempt.student_id == Student.user_id,
+            TestAttempt.status.in_([TestStatus.IN_PROGRESS, TestStatus.COMPLETED])
+        )
+    ).filter(
+        Student.user_id == current_user.id
+    ).all()
     
-    if not student_profile:
+    # Ensure student profile exists
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Student profile not found. Please complete your registration."
         )
     
     # Check if user has already completed a test (ONE ATTEMPT ONLY)
-    completed_attempt = db.query(TestAttempt).filter(
-        TestAttempt.student_id == current_user.id,
-        TestAttempt.status == TestStatus.COMPLETED
-    ).first()
-    
-    if completed_attempt:
+    if any(row[2] == TestStatus.COMPLETED for row in rows):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You have already completed the test. Each student can attempt the test only once."
         )
     
     # Check if user has an in-progress test
-    existing_attempt = db.query(TestAttempt).filter(
-        TestAttempt.student_id == current_user.id,
-        TestAttempt.status == TestStatus.IN_PROGRESS
-    ).first()
+    existing_attempt = next((row for row in rows if row[2] == TestStatus.IN_PROGRESS), None)
     
     # If exists → return it (do NOT error)
     if existing_attempt:
-        total_questions = db.query(Question).filter(Question.is_active == True).count()
+        total_questions = get_active_question_count(db)
+        _, attempt_id, attempt_status, started_at = existing_attempt
         return {
-            "test_attempt_id": existing_attempt.id,
-            "status": existing_attempt.status.value,
-            "started_at": existing_attempt.started_at,
+            "test_attempt_id": attempt_id,
+            "status": attempt_status.value,
+            "started_at": started_at,
             "total_questions": total_questions
         }
     
     # Get total questions count
-    total_questions = db.query(Question).filter(Question.is_active == True).count()
+    total_questions = get_active_question_count(db)
     
     # Create new test attempt
     test_attempt = TestAttempt(
@@ -266,7 +455,7 @@ async def start_test(
 
 
 @router.post("/submit", response_model=TestResultResponse, status_code=status.HTTP_200_OK)
-async def submit_answers(
+def submit_answers(
     submit_data: SubmitAnswersRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_student)
@@ -316,10 +505,17 @@ async def submit_answers(
                 detail=f"Question {qid} is invalid or not active"
             )
     
+    # One answer per question (unique index on test_attempt_id, question_id)
+    if len(set(question_ids)) != len(question_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Duplicate question_id in answers"
+        )
+    
     # Check for duplicate submissions
-    existing_answers = db.query(Answer).filter(
+    existing_answers = db.query(func.count(Answer.id)).filter(
         Answer.test_attempt_id == test_attempt_id
-    ).count()
+    ).scalar()
     
     if existing_answers > 0:
         raise HTTPException(
@@ -327,26 +523,26 @@ async def submit_answers(
             detail="Answers already submitted for this attempt"
         )
     
-    # Save answers
-    for answer_data in submit_data.answers:
-        answer = Answer(
-            test_attempt_id=test_attempt_id,
-            question_id=answer_data.question_id,
-            answer_text=answer_data.selected_option
-        )
-        db.add(answer)
-    
-    # Calculate score
-    correct_count = 0
-    for answer_data in submit_data.answers:
-        question = question_map[answer_data.question_id]
-        if question.correct_answer and answer_data.selected_option.upper() == question.correct_answer.upper():
-            correct_count += 1
+    # Save answers in one multi-row INSERT
+    db.execute(insert(Answer), [
+        {
+            "test_attempt_id": test_attempt_id,
+            "question_id": answer_data.question_id,
+            "answer_text": answer_data.selected_option
+        }
+        for answer_data in submit_data.answers
+    ])
+    
+    # Calculate score against answer keys normalised once (questions without a key never match)
+    answer_keys = {q.id: q.correct_answer.upper() for q in all_questions if q.correct_answer}
+    correct_count = sum(
+        1 for answer_data in submit_data.answers
+        if answer_keys.get(answer_data.question_id) == answer_data.selected_option.upper()
+    )
     
     percentage = (correct_count / total_questions * 100) if total_questions > 0 else 0.0
     
     # Create Score record
-    from models import Score
     score = Score(
         test_attempt_id=test_attempt_id,
         dimension="overall",
@@ -361,6 +557,7 @@ async def submit_answers(
     test_attempt.completed_at = datetime.now(timezone.utc)
     
     db.commit()
+    remember_completed_attempt(current_user.id, test_attempt.id)
     
     return TestResultResponse(
         total_questions=total_questions,
@@ -371,7 +568,7 @@ async def submit_answers(
 
 
 @router.post("/{test_attempt_id}/complete", status_code=status.HTTP_200_OK)
-async def complete_test(
+def complete_test(
     test_attempt_id: int,
     auto_submit: bool = Query(False, description="Skip validation for auto-submit cases (timer expiry)"),
     db: Session = Depends(get_db),
@@ -395,11 +592,11 @@ async def complete_test(
             detail="Test attempt not found"
         )
     
-    print(f"🔵 Complete test: attempt_id={test_attempt_id}, status={test_attempt.status}, auto_submit={auto_submit}")
+    logger.debug("Complete test: attempt_id=%s, status=%s, auto_submit=%s", test_attempt_id, test_attempt.status, auto_submit)
     
     # Make endpoint idempotent: if already completed, return success
     if test_attempt.status == TestStatus.COMPLETED:
-        print(f"✅ Test {test_attempt_id} already completed, returning success (idempotent)")
+        logger.debug("Test %s already completed, returning success (idempotent)", test_attempt_id)
         return {
             "message": "Test already completed",
             "test_attempt_id": test_attempt_id,
@@ -413,43 +610,43 @@ async def complete_test(
             detail=f"Test attempt is not in progress (current status: {test_attempt.status.value})"
         )
     
-    # Check if all sections are completed (section-wise flow)
-    active_sections = db.query(Section).filter(Section.is_active == True).order_by(Section.order_index).all()
-    active_section_count = len(active_sections)
+    # Check if all sections are completed (section-wise flow): active vs completed counts in one query
+    active_section_count, completed_count = db.query(
+        func.count(Section.id),
+        func.count(distinct(SectionProgress.section_id))
+    ).select_from(Section).outerjoin(
+        SectionProgress,
+        and_(
+            SectionProgress.section_id == Section.id,
+            SectionProgress.test_attempt_id == test_attempt_id,
+            SectionProgress.status == SectionStatus.COMPLETED
+        )
+    ).filter(Section.is_active == True).one()
+    
+    logger.debug("Section completion check: %s/%s", completed_count, active_section_count)
     
-    if active_section_count > 0:
-        # Get all section progress records for this attempt
+    if active_section_count > 0 and completed_count < active_section_count:
+        # Only load the section list when it's needed for the error message
+        active_sections = db.query(Section).filter(Section.is_active == True).order_by(Section.order_index).all()
         all_progress = db.query(SectionProgress).filter(
             SectionProgress.test_attempt_id == test_attempt_id
         ).all()
-        
-        # Count completed sections by matching section IDs
         completed_section_ids = {
             p.section_id for p in all_progress 
             if p.status == SectionStatus.COMPLETED
         }
+        missing_sections_list = [
+            f"Section {section.order_index} ({section.name})"
+            for section in active_sections
+            if section.id not in completed_section_ids
+        ]
         
-        # Check which sections are completed
-        completed_sections_list = []
-        missing_sections_list = []
-        for section in active_sections:
-            if section.id in completed_section_ids:
-                completed_sections_list.append(f"Section {section.order_index}")
-            else:
-                missing_sections_list.append(f"Section {section.order_index} ({section.name})")
-        
-        completed_count = len(completed_sections_list)
-        
-        print(f"🔵 Section completion check: {completed_count}/{active_section_count}")
-        print(f"  Completed: {completed_sections_list}")
-        print(f"  Missing: {missing_sections_list}")
-        print(f"  All progress records: {[(p.section_id, p.status.value) for p in all_progress]}")
+        logger.debug("Missing sections for attempt %s: %s", test_attempt_id, missing_sections_list)
         
-        if completed_count < active_section_count:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Please complete all sections. {completed_count}/{active_section_count} sections completed. Missing: {', '.join(missing_sections_list)}"
-            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Please complete all sections. {completed_count}/{active_section_count} sections completed. Missing: {', '.join(missing_sections_list)}"
+        )
     
     # Calculate expected total questions from sections (5 sections × 7 questions = 35)
     # IMPORTANT: Always use expected_total_questions (35) for validation, NOT database count
@@ -457,14 +654,17 @@ async def complete_test(
     expected_total_questions = TOTAL_SECTIONS * QUESTIONS_PER_SECTION  # 5 * 7 = 35
     
     # Get answered questions count
-    answered_questions = db.query(Answer).filter(
+    answered_questions = db.query(func.count(Answer.id)).filter(
         Answer.test_attempt_id == test_attempt_id
-    ).count()
+    ).scalar()
     
     # Get actual database count for logging
-    db_total_questions = db.query(Question).filter(Question.is_active == True).count()
+    db_total_questions = get_active_question_count(db)
     
-    print(f"🔵 Question check: {answered_questions}/{expected_total_questions} answered (DB has {db_total_questions} active questions, auto_submit={auto_submit})")
+    logger.debug(
+        "Question check: %s/%s answered (DB has %s active questions, auto_submit=%s)",
+        answered_questions, expected_total_questions, db_total_questions, auto_submit
+    )
     
     # Validate that all expected questions are answered (35 questions)
     if answered_questions < expected_total_questions:
@@ -474,17 +674,17 @@ async def complete_test(
         )
     
     if answered_questions > expected_total_questions:
-        print(f"⚠️ Warning: More answers ({answered_questions}) than expected ({expected_total_questions}), proceeding with validation")
+        logger.warning("More answers (%s) than expected (%s), proceeding with validation", answered_questions, expected_total_questions)
     
     # Log if database count differs from expected (for debugging)
     if db_total_questions != expected_total_questions:
-        print(f"⚠️ Info: Database has {db_total_questions} active questions, expected {expected_total_questions} (using expected for validation)")
+        logger.info("Database has %s active questions, expected %s (using expected for validation)", db_total_questions, expected_total_questions)
     
     # Calculate and store scores (scores are calculated from all answers, regardless of sections)
     try:
         store_scores(db, test_attempt_id)
     except Exception as e:
-        print(f"❌ Error calculating scores: {e}")
+        logger.error("Error calculating scores for test %s: %s", test_attempt_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to calculate scores"
@@ -496,26 +696,27 @@ async def complete_test(
     test_attempt.completed_at = datetime.now(timezone.utc)
     db.commit()
     db.refresh(test_attempt)
+    remember_completed_attempt(test_attempt.student_id, test_attempt.id)
     
-    print(f"✅ Test {test_attempt_id} marked as COMPLETED")
+    logger.info("Test %s marked as COMPLETED", test_attempt_id)
     
     # Auto-create interpretation if it doesn't exist
     try:
-        interpreted_result = db.query(InterpretedResult).filter(
+        # Existence probe only; the interpretation payload itself is not needed here
+        interpreted_result_id = db.query(InterpretedResult.id).filter(
             InterpretedResult.test_attempt_id == test_attempt_id
-        ).first()
+        ).scalar()
         
-        if not interpreted_result:
-            print(f"🔵 Auto-creating interpretation for test {test_attempt_id}")
+        if interpreted_result_id is None:
+            logger.debug("Auto-creating interpretation for test %s", test_attempt_id)
             # Get score for interpretation
-            score = db.query(Score).filter(
+            percentage = db.query(Score.score_value).filter(
                 Score.test_attempt_id == test_attempt_id,
                 Score.dimension == "overall"
-            ).first()
+            ).limit(1).scalar()
             
-            if score:
+            if percentage is not None:
                 total_questions = expected_total_questions
-                percentage = score.score_value
                 correct_answers = int((percentage / 100) * total_questions) if percentage <= 100 else total_questions
                 
                 # Generate interpretation in background (non-blocking)
@@ -523,12 +724,12 @@ async def complete_test(
                     generate_and_save_interpretation(
                         db, test_attempt_id, total_questions, correct_answers, percentage
                     )
-                    print(f"✅ Interpretation generated for test {test_attempt_id}")
+                    logger.info("Interpretation generated for test %s", test_attempt_id)
                 except Exception as e:
-                    print(f"⚠️ Failed to generate interpretation: {e}")
+                    logger.warning("Failed to generate interpretation for test %s: %s", test_attempt_id, e)
                     # Don't fail the completion if interpretation generation fails
     except Exception as e:
-        print(f"⚠️ Error during interpretation auto-creation: {e}")
+        logger.warning("Error during interpretation auto-creation for test %s: %s", test_attempt_id, e)
         # Don't fail the completion if interpretation creation fails
     
     return {
@@ -540,56 +741,52 @@ async def complete_test(
 
 
 @router.get("/{test_attempt_id}/status", response_model=TestStatusResponse)
-async def get_test_status(
+def get_test_status(
     test_attempt_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_student)
 ):
     """Get test attempt status (without raw scores)"""
-    # Verify test attempt belongs to current user
-    test_attempt = db.query(TestAttempt).filter(
+    # Verify test attempt belongs to current user, fetching the answered count in the same round-trip
+    answered_questions_q = select(func.count(Answer.id)).where(
+        Answer.test_attempt_id == TestAttempt.id
+    ).scalar_subquery()
+    row = db.query(TestAttempt, answered_questions_q).filter(
         TestAttempt.id == test_attempt_id,
         TestAttempt.student_id == current_user.id
     ).first()
     
-    if not test_attempt:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Test attempt not found"
         )
+    test_attempt, answered_questions = row
+    total_questions = get_active_question_count(db)
+    
+    # All sections with a completed flag for this attempt, in one query
+    section_rows = db.query(Section.order_index, Section.is_active, SectionProgress.id).outerjoin(
+        SectionProgress,
+        and_(
+            SectionProgress.section_id == Section.id,
+            SectionProgress.test_attempt_id == test_attempt_id,
+            SectionProgress.status == SectionStatus.COMPLETED
+        )
+    ).order_by(Section.order_index).all()
     
-    total_questions = db.query(Question).filter(Question.is_active == True).count()
-    answered_questions = db.query(Answer).filter(
-        Answer.test_attempt_id == test_attempt_id
-    ).count()
-    
-    # Get completed sections by querying SectionProgress
-    completed_progresses = db.query(SectionProgress).filter(
-        SectionProgress.test_attempt_id == test_attempt_id,
-        SectionProgress.status == SectionStatus.COMPLETED
-    ).all()
-    
-    # Get section order_index for each completed section
-    completed_sections = []
-    for progress in completed_progresses:
-        section = db.query(Section).filter(Section.id == progress.section_id).first()
-        if section:
-            completed_sections.append(section.order_index)
-    
-    # Sort completed sections
-    completed_sections = sorted(completed_sections)
+    completed_sections = [order_index for order_index, _, progress_id in section_rows if progress_id is not None]
     
     # Find current section (next incomplete section)
-    all_sections = db.query(Section).filter(Section.is_active == True).order_by(Section.order_index).all()
-    current_section = None
-    for section in all_sections:
-        if section.order_index not in completed_sections:
-            current_section = section.order_index
-            break
+    active_order_indices = [order_index for order_index, is_active, _ in section_rows if is_active]
+    completed_set = set(completed_sections)
+    current_section = next(
+        (order_index for order_index in active_order_indices if order_index not in completed_set),
+        None
+    )
     
     # If all sections completed, current_section is None
     # Get total sections from database (should be 5)
-    total_sections = db.query(Section).filter(Section.is_active == True).count()
+    total_sections = len(active_order_indices)
     if total_sections == 0:
         total_sections = TOTAL_SECTIONS  # Fallback to constant if no sections found
     
@@ -606,23 +803,35 @@ async def get_test_status(
     }
 
 
-@router.get("/interpretation/{test_attempt_id}", response_model=InterpretationResponse)
-async def get_interpretation(
+@router.get(
+    "/interpretation/{test_attempt_id}",
+    response_model=None,
+    responses={200: {"model": InterpretationResponse}}
+)
+def get_interpretation(
     test_attempt_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_student_or_counsellor)
 ):
     """Get or generate AI interpretation for test attempt (Student or Counsellor)"""
-    # Verify test attempt exists
-    test_attempt = db.query(TestAttempt).filter(
+    # Verify test attempt exists; the answered count comes back in the same row and
+    # the interpretation and scores are loaded alongside it
+    answered_count_q = select(func.count(Answer.id)).where(
+        Answer.test_attempt_id == TestAttempt.id
+    ).scalar_subquery()
+    row = db.query(TestAttempt, answered_count_q).options(
+        selectinload(TestAttempt.interpreted_result),
+        selectinload(TestAttempt.scores)
+    ).filter(
         TestAttempt.id == test_attempt_id
     ).first()
     
-    if not test_attempt:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Test attempt not found"
         )
+    test_attempt, answered_count = row
     
     # If student, verify it's their attempt
     if current_user.role == UserRole.STUDENT and test_attempt.student_id != current_user.id:
@@ -641,19 +850,14 @@ async def get_interpretation(
     expected_total_questions = TOTAL_SECTIONS * QUESTIONS_PER_SECTION  # 5 * 7 = 35
     
     # Check if interpretation already exists
-    interpreted_result = db.query(InterpretedResult).filter(
-        InterpretedResult.test_attempt_id == test_attempt_id
-    ).first()
+    interpreted_result = test_attempt.interpreted_result
     
     # Get score data
-    score = db.query(Score).filter(
-        Score.test_attempt_id == test_attempt_id,
-        Score.dimension == "overall"
-    ).first()
+    score = next((s for s in test_attempt.scores if s.dimension == "overall"), None)
     
     if not score:
         # Auto-create score if missing (shouldn't happen, but handle gracefully)
-        print(f"⚠️ Score not found for test {test_attempt_id}, attempting to calculate...")
+        logger.warning("Score not found for test %s, attempting to calculate...", test_attempt_id)
         try:
             store_scores(db, test_attempt_id)
             score = db.query(Score).filter(
@@ -661,12 +865,12 @@ async def get_interpretation(
                 Score.dimension == "overall"
             ).first()
         except Exception as e:
-            print(f"❌ Failed to calculate score: {e}")
+            logger.error("Failed to calculate score for test %s: %s", test_attempt_id, e)
         
         if not score:
             # Return a default interpretation instead of 404
-            print(f"⚠️ Still no score found, returning default interpretation")
-            return InterpretationResponse(
+            logger.warning("Still no score found for test %s, returning default interpretation", test_attempt_id)
+            return ORJSONResponse(InterpretationResponse(
                 summary="Assessment results are being processed. Please check back in a moment.",
                 strengths=[],
                 weaknesses=[],
@@ -678,10 +882,7 @@ async def get_interpretation(
                 total_questions=expected_total_questions,
                 correct_answers=0,
                 is_ai_generated=False
-            )
-    
-    # Get answered questions count
-    answered_count = db.query(Answer).filter(Answer.test_attempt_id == test_attempt_id).count()
+            ).model_dump())
     
     # Validate that all expected questions are answered (35 questions)
     if answered_count < expected_total_questions:
@@ -698,7 +899,7 @@ async def get_interpretation(
     
     # Clamp percentage to valid range (0-100) if somehow invalid, but don't recalculate
     if percentage < 0 or percentage > 100:
-        print(f"⚠️ Warning: Invalid percentage {percentage} for test {test_attempt_id}, clamping to valid range")
+        logger.warning("Invalid percentage %s for test %s, clamping to valid range", percentage, test_attempt_id)
         percentage = max(0.0, min(100.0, percentage))
     
     # Calculate correct_answers for display purposes only (not stored, just for API response)
@@ -710,34 +911,29 @@ async def get_interpretation(
             interpreted_result, interpretation_data = generate_and_save_interpretation(
                 db, test_attempt_id, total_questions, correct_answers, percentage
             )
-            print(f"✅ Interpretation generated for test {test_attempt_id}")
+            logger.info("Interpretation generated for test %s", test_attempt_id)
         except Exception as e:
-            print(f"⚠️ Failed to generate interpretation: {e}")
+            logger.warning("Failed to generate interpretation for test %s: %s", test_attempt_id, e)
             # Return a processing message instead of 404
             from services.gemini_interpreter import (
                 calculate_readiness_status, calculate_risk_level,
                 determine_career_direction, generate_action_roadmap
             )
-            from models import Section
             
             readiness_status, readiness_explanation = calculate_readiness_status(percentage)
             risk_level, risk_explanation = calculate_risk_level(readiness_status)
             
-            sections = {}
-            section_objs = db.query(Section).all()
-            for section in section_objs:
-                sections[section.order_index] = section.name
+            sections = get_section_names(db)
             
             section_scores_dict = {}
-            scores_query = db.query(Score).filter(Score.test_attempt_id == test_attempt_id).all()
-            for score in scores_query:
+            for score in test_attempt.scores:
                 if score.dimension.startswith("section_"):
                     section_scores_dict[score.dimension] = score.score_value
             
             career_direction, career_direction_reason = determine_career_direction(section_scores_dict, sections, percentage)
             roadmap = generate_action_roadmap(readiness_status, percentage)
             
-            return InterpretationResponse(
+            return ORJSONResponse(InterpretationResponse(
                 summary="AI interpretation is being generated. Please refresh in a moment.",
                 strengths=[],
                 weaknesses=[],
@@ -754,28 +950,22 @@ async def get_interpretation(
                 career_direction=career_direction,
                 career_direction_reason=career_direction_reason,
                 roadmap=roadmap
-            )
+            ).model_dump())
     else:
         # Parse existing interpretation - regenerate missing fields if needed
-        import json
         from services.gemini_interpreter import (
             calculate_readiness_status, calculate_risk_level,
             determine_career_direction, generate_action_roadmap,
             generate_counsellor_style_summary
         )
-        from models import Section
         
         readiness_status, readiness_explanation = calculate_readiness_status(percentage)
         risk_level, risk_explanation = calculate_risk_level(readiness_status)
         
-        sections = {}
-        section_objs = db.query(Section).all()
-        for section in section_objs:
-            sections[section.order_index] = section.name
+        sections = get_section_names(db)
         
         section_scores_dict = {}
-        scores_query = db.query(Score).filter(Score.test_attempt_id == test_attempt_id).all()
-        for score in scores_query:
+        for score in test_attempt.scores:
             if score.dimension.startswith("section_"):
                 section_scores_dict[score.dimension] = score.score_value
         
@@ -786,8 +976,8 @@ async def get_interpretation(
             "summary": interpreted_result.interpretation_text or generate_counsellor_style_summary(
                 percentage, readiness_status, career_direction, total_questions, correct_answers
             ),
-            "strengths": json.loads(interpreted_result.strengths) if interpreted_result.strengths else [],
-            "weaknesses": json.loads(interpreted_result.areas_for_improvement) if interpreted_result.areas_for_improvement else [],
+            "strengths": orjson.loads(interpreted_result.strengths) if interpreted_result.strengths else [],
+            "weaknesses": orjson.loads(interpreted_result.areas_for_improvement) if interpreted_result.areas_for_improvement else [],
             "career_clusters": [career_direction],
             "risk_level": risk_level,
             "readiness_status": readiness_status,
@@ -807,7 +997,7 @@ async def get_interpretation(
     if interpreted_result:
         is_ai_generated = interpreted_result.is_ai_generated
     
-    return InterpretationResponse(
+    return ORJSONResponse(InterpretationResponse(
         summary=interpretation_data.get("summary", ""),
         strengths=interpretation_data.get("strengths", []),
         weaknesses=interpretation_data.get("weaknesses", []),
@@ -824,7 +1014,7 @@ async def get_interpretation(
         career_direction=interpretation_data.get("career_direction", "Multi-domain Exploration"),
         career_direction_reason=interpretation_data.get("career_direction_reason", ""),
         roadmap=interpretation_data.get("roadmap", {})
-    )
+    ).model_dump())
 
 
 # ========== SECTION-WISE TEST FLOW ENDPOINTS ==========
@@ -880,321 +1070,297 @@ class SectionsListResponse(BaseModel):
         from_attributes = True
 
 
-@router.get("/sections", response_model=SectionsListResponse)
-async def get_sections(
+def section_list_status(order_index: int, current_section: int, completed_orders: frozenset) -> str:
+    """
+    Listing status of a section: "available", "completed" or "locked".
+    Without an attempt, current_section is 1 and completed_orders is empty.
+    """
+    if order_index == 1:
+        # CRITICAL: Section 1 is NEVER locked
+        return "completed" if 1 in completed_orders else "available"
+    if current_section in (0, 1):
+        # Section 1 is current - all sections 2-5 are locked
+        return "locked"
+    if order_index < current_section:
+        # Section is before current - should be completed
+        return "completed"
+    if order_index == current_section:
+        return "completed" if order_index in completed_orders else "available"
+    # Section is after current - available only once every previous section is completed
+    if all(previous in completed_orders for previous in range(1, order_index)):
+        return "available"
+    return "locked"
+
+
+def first_incomplete_previous_section(db: Session, attempt_id: int, order_index: int) -> Optional[str]:
+    """
+    Name of the first active section before order_index that the attempt has not
+    completed, or None if all are completed. One query with NOT EXISTS; no
+    progress rows are loaded.
+    """
+    completed = exists().where(
+        SectionProgress.section_id == Section.id,
+        SectionProgress.test_attempt_id == attempt_id,
+        SectionProgress.status == SectionStatus.COMPLETED
+    )
+    return db.query(Section.name).filter(
+        Section.order_index < order_index,
+        Section.is_active == True,
+        ~completed
+    ).order_by(Section.order_index).limit(1).scalar()
+
+
+# Section lookup statements, built once at import and executed with bound parameters
+# (:sid is the requested section ID, :aid the attempt). A section matches on ID, or on
+# order_index for ids 1-5; an exact ID match sorts first.
+_SID = bindparam("sid", type_=Integer)
+_AID = bindparam("aid", type_=Integer)
+_SECTION_MATCH = or_(Section.id == _SID, and_(_SID.between(1, 5), Section.order_index == _SID))
+_SECTION_MATCH_ORDER = case((Section.id == _SID, 0), else_=1)
+_PROGRESS_JOIN = and_(SectionProgress.section_id == Section.id, SectionProgress.test_attempt_id == _AID)
+
+_SECTION_STMT = select(Section).where(_SECTION_MATCH).order_by(_SECTION_MATCH_ORDER).limit(1)
+
+_SECTION_WITH_PROGRESS_STMT = select(Section, SectionProgress).outerjoin(
+    SectionProgress, _PROGRESS_JOIN
+).where(_SECTION_MATCH).order_by(_SECTION_MATCH_ORDER).limit(1)
+
+# submit_section: also flags whether the attempt already has answers in the section
+_SECTION_FOR_SUBMIT_STMT = select(
+    Section,
+    SectionProgress,
+    exists().where(
+        Answer.test_attempt_id == _AID,
+        Answer.question_id == Question.id,
+        Question.section_id == Section.id
+    ).label("has_answers")
+).outerjoin(
+    SectionProgress, _PROGRESS_JOIN
+).where(_SECTION_MATCH).order_by(_SECTION_MATCH_ORDER).limit(1)
+
+_SECTION_QUESTION_IDS_STMT = select(Question.id).where(
+    Question.section_id == bindparam("section_db_id", type_=Integer),
+    Question.is_active == True
+)
+
+
+def resolve_section(db: Session, section_id: int) -> Optional[Section]:
+    """
+    Find a section by ID, falling back to order_index for ids 1-5 (placeholder
+    sections in the listing use their order_index as ID). One query; an exact
+    ID match wins over an order_index match.
+    """
+    return db.execute(_SECTION_STMT, {"sid": section_id}).scalar()
+
+
+def resolve_section_with_progress(
+    db: Session, section_id: int, attempt_id: int
+) -> Tuple[Optional[Section], Optional[SectionProgress]]:
+    """resolve_section plus the attempt's progress row for that section, in the same query."""
+    row = db.execute(_SECTION_WITH_PROGRESS_STMT, {"sid": section_id, "aid": attempt_id}).first()
+    return row if row else (None, None)
+
+
+def complete_expired_sections(db: Session) -> int:
+    """
+    Mark running sections whose time limit has passed as COMPLETED, in one UPDATE.
+    Run periodically in the background so expired sections are closed even when
+    nobody polls their timer. Returns the number of sections completed.
+    """
+    now = datetime.now(timezone.utc)
+    running = db.query(
+        SectionProgress.id, SectionProgress.section_start_time, SectionProgress.total_time_spent
+    ).filter(
+        SectionProgress.status == SectionStatus.IN_PROGRESS,
+        SectionProgress.section_start_time.isnot(None),
+        SectionProgress.paused_at.is_(None)
+    ).all()
+    
+    expired_ids = []
+    for progress_id, section_start_time, total_time_spent in running:
+        if section_start_time.tzinfo is None:
+            section_start_time = section_start_time.replace(tzinfo=timezone.utc)
+        if total_time_spent + int((now - section_start_time).total_seconds()) >= SECTION_TIME_LIMIT:
+            expired_ids.append(progress_id)
+    
+    if not expired_ids:
+        return 0
+    
+    # Re-check the running state so a submit/pause committed since the read is not overwritten
+    result = db.execute(
+        update(SectionProgress).where(
+            SectionProgress.id.in_(expired_ids),
+            SectionProgress.status == SectionStatus.IN_PROGRESS,
+            SectionProgress.section_start_time.isnot(None),
+            SectionProgress.paused_at.is_(None)
+        ).values(
+            total_time_spent=SECTION_TIME_LIMIT,
+            section_start_time=None,
+            status=SectionStatus.COMPLETED,
+            paused_at=None
+        ),
+        execution_options={"synchronize_session": False}
+    )
+    db.commit()
+    return result.rowcount
+
+
+@router.get(
+    "/sections",
+    response_model=None,
+    responses={200: {"model": SectionsListResponse}}
+)
+def get_sections(
+    request: Request,
     attempt_id: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_student)
 ):
     """Get all active sections with status for current student's test attempt"""
     # Check if student has already completed a test (ONE ATTEMPT ONLY)
-    # Query for ANY completed attempt for this student
-    completed_attempt = db.query(TestAttempt).filter(
-        TestAttempt.student_id == current_user.id,
-        TestAttempt.status == TestStatus.COMPLETED
-    ).order_by(TestAttempt.completed_at.desc()).first()  # Get most recent completed attempt
+    completed_test_attempt_id = get_completed_attempt_id(db, current_user.id)
+    can_attempt_test = completed_test_attempt_id is None
     
-    can_attempt_test = completed_attempt is None
-    completed_test_attempt_id = completed_attempt.id if completed_attempt else None
-    
-    # Debug logging
-    print(f"🔵 get_sections for user {current_user.id}: can_attempt_test={can_attempt_test}, completed_test_attempt_id={completed_test_attempt_id}")
-    if completed_attempt:
-        print(f"   Found completed attempt: ID={completed_attempt.id}, completed_at={completed_attempt.completed_at}")
+    logger.debug(
+        "get_sections for user %s: can_attempt_test=%s, completed_test_attempt_id=%s",
+        current_user.id, can_attempt_test, completed_test_attempt_id
+    )
     
-    # Find current test attempt for this student (in progress or completed)
+    # After completion the listing no longer changes (no new attempt can be started),
+    # so it is served from the serialized copy cached on first build
+    if completed_test_attempt_id is not None:
+        done_key = (current_user.id, completed_test_attempt_id)
+        with _SECTIONS_DONE_LOCK:
+            body = _SECTIONS_DONE_CACHE.get(done_key)
+        if body is not None:
+            return etag_body_response(request, body, "private, no-cache")
+    
+    # Read-only listing: plain Core selects of the needed columns, no ORM entities
+    # Find the current in-progress test attempt for this student
+    test_attempt_q = select(TestAttempt.id).where(
+        TestAttempt.student_id == current_user.id,
+        TestAttempt.status == TestStatus.IN_PROGRESS
+    )
     if attempt_id:
-        test_attempt = db.query(TestAttempt).filter(
-            TestAttempt.id == attempt_id,
-            TestAttempt.student_id == current_user.id,
-            TestAttempt.status == TestStatus.IN_PROGRESS
-        ).first()
-    else:
-        test_attempt = db.query(TestAttempt).filter(
-            TestAttempt.student_id == current_user.id,
-            TestAttempt.status == TestStatus.IN_PROGRESS
-        ).first()
-    
-    # FIXED: Define all 5 sections - ALWAYS return all 5 sections
-    # This ensures sections are returned regardless of database state
-    sections_config = [
-        {
-            "order_index": 1,
-            "name": "Section 1: Intelligence Test (Cognitive Reasoning)",
-            "description": "Logical Reasoning, Numerical Reasoning, Verbal Reasoning, Abstract Reasoning"
-        },
-        {
-            "order_index": 2,
-            "name": "Section 2: Aptitude Test",
-            "description": "Numerical Aptitude, Logical Aptitude, Verbal Aptitude, Spatial/Mechanical Aptitude"
-        },
-        {
-            "order_index": 3,
-            "name": "Section 3: Study Habits",
-            "description": "Concentration, Consistency, Time Management, Exam Preparedness, Self-discipline"
-        },
-        {
-            "order_index": 4,
-            "name": "Section 4: Learning Style",
-            "description": "Visual, Auditory, Reading/Writing, Kinesthetic"
-        },
-        {
-            "order_index": 5,
-            "name": "Section 5: Career Interest (RIASEC)",
-            "description": "Realistic, Investigative, Artistic, Social, Enterprising, Conventional"
-        }
-    ]
+        test_attempt_q = test_attempt_q.where(TestAttempt.id == attempt_id)
+    test_attempt_id = db.execute(test_attempt_q.limit(1)).scalar()
     
     # Get sections from database, but ensure we have all 5
-    db_sections = db.query(Section).filter(
-        Section.is_active == True
-    ).order_by(Section.order_index).all()
+    db_sections = db.execute(
+        select(Section.id, Section.name, Section.order_index).where(
+            Section.is_active == True
+        ).order_by(Section.order_index)
+    ).all()
     
     # Create a map of order_index -> Section for quick lookup
     db_sections_map = {s.order_index: s for s in db_sections}
     
-    # Build all_sections list - always 5 sections
-    all_sections = []
-    print(f"🔵 Building sections: DB has {len(db_sections)} sections, config has {len(sections_config)} sections")
-    for config in sections_config:
-        order_idx = config["order_index"]
-        if order_idx in db_sections_map:
-            # Use database section if it exists
-            print(f"  ✅ Using DB section {order_idx}: {db_sections_map[order_idx].name}")
-            all_sections.append(db_sections_map[order_idx])
-        else:
-            # Create a temporary section object from config if not in DB
-            # This ensures we always return 5 sections
-            print(f"  ⚠️ Creating temp section {order_idx}: {config['name']}")
-            temp_section = type('Section', (), {
-                'id': order_idx,  # Use order_index as temporary ID
-                'name': config["name"],
-                'description': config["description"],
-                'order_index': order_idx,
-                'is_active': True
-            })()
-            all_sections.append(temp_section)
-    
-    print(f"🔵 Total sections built: {len(all_sections)}")
-    
-    # Determine current section based on progress
-    current_section_index = 0  # 0 means no section started yet
-    
-    if test_attempt:
-        # Find the current section based on progress
-        # Look for in-progress sections first
-        in_progress_progress = db.query(SectionProgress).filter(
-            SectionProgress.test_attempt_id == test_attempt.id,
-            SectionProgress.status == SectionStatus.IN_PROGRESS
+    # Build all_sections list - always 5 sections; a section missing from the DB
+    # falls back to its placeholder built from SECTIONS_CONFIG
+    all_sections = [
+        db_sections_map.get(order_idx) or TEMP_SECTIONS[order_idx]
+        for order_idx in sorted(TEMP_SECTIONS)
+    ]
+    
+    # Load (section_id, status, order_index) for every progress row of the attempt in one
+    # query; the current section and all statuses below are resolved from these rows
+    progress_rows = []
+    if test_attempt_id is not None:
+        progress_rows = db.execute(
+            select(SectionProgress.section_id, SectionProgress.status, Section.order_index).join(
+                Section, Section.id == SectionProgress.section_id
+            ).where(
+                SectionProgress.test_attempt_id == test_attempt_id
+            ).order_by(Section.order_index)
         ).all()
-        
-        if in_progress_progress:
-            # Get the section order_index for the in-progress section
-            for progress in in_progress_progress:
-                section = db.query(Section).filter(Section.id == progress.section_id).first()
-                if section:
-                    current_section_index = section.order_index
-                    break
-        else:
-            # Find the highest completed section
-            completed_progress = db.query(SectionProgress).filter(
-                SectionProgress.test_attempt_id == test_attempt.id,
-                SectionProgress.status == SectionStatus.COMPLETED
-            ).all()
-            
-            if completed_progress:
-                # Get order_index for all completed sections
-                completed_order_indices = []
-                for progress in completed_progress:
-                    section = db.query(Section).filter(Section.id == progress.section_id).first()
-                    if section:
-                        completed_order_indices.append(section.order_index)
-                
-                if completed_order_indices:
-                    highest_completed = max(completed_order_indices)
-                    if highest_completed < 5:  # If not all sections completed
-                        current_section_index = highest_completed + 1
-                    else:
-                        current_section_index = 5  # All sections completed
-                else:
-                    # No valid sections found - default to Section 1
-                    current_section_index = 1
-            else:
-                # No progress at all - Section 1 should be available
-                current_section_index = 1
+    status_by_section_id = {section_id: progress_status for section_id, progress_status, _ in progress_rows}
+    
+    # Determine current section based on progress: the in-progress section if any,
+    # else the one after the highest completed section (capped at 5), else Section 1
+    in_progress_orders = [o for _, st, o in progress_rows if st == SectionStatus.IN_PROGRESS]
+    completed_progress_orders = [o for _, st, o in progress_rows if st == SectionStatus.COMPLETED]
+    if in_progress_orders:
+        current_section_index = in_progress_orders[0]
+    elif completed_progress_orders:
+        current_section_index = min(5, max(completed_progress_orders) + 1)
+    else:
+        current_section_index = 1
     
     # If no attempt or current_section is 0, default to Section 1
-    if not test_attempt or current_section_index == 0:
+    if test_attempt_id is None or current_section_index == 0:
         current_section_index = 1
     
+    # Active question count per section in one GROUP BY instead of a COUNT per section
+    section_ids = [section.id for section in all_sections if isinstance(section.id, int) and section.id > 0]
+    question_counts = dict(
+        db.execute(
+            select(Question.section_id, func.count(Question.id)).where(
+                Question.section_id.in_(section_ids),
+                Question.is_active == True
+            ).group_by(Question.section_id)
+        ).all()
+    )
+    
+    # Order indices of the listed sections this attempt has completed
+    completed_orders = frozenset(
+        section.order_index for section in all_sections
+        if status_by_section_id.get(section.id) == SectionStatus.COMPLETED
+    )
+    
     sections_result = []
-    print(f"🔵 Processing {len(all_sections)} sections for response")
     
     for section in all_sections:
         try:
-            print(f"  Processing section {section.order_index}: {section.name}")
-            # CRITICAL: Section 1 is NEVER locked
-            if section.order_index == 1:
-                if not test_attempt:
-                    # No attempt - Section 1 is always available
-                    section_status = "available"
-                else:
-                    # Check Section 1 progress - need to find section by order_index if temp section
-                    section1_id = section.id if (hasattr(section, 'id') and isinstance(section.id, int) and section.id > 0) else None
-                    
-                    if section1_id:
-                        # Real database section - query by ID
-                        section1_progress = db.query(SectionProgress).filter(
-                            SectionProgress.test_attempt_id == test_attempt.id,
-                            SectionProgress.section_id == section1_id
-                        ).first()
-                    else:
-                        # Temp section - find by order_index
-                        db_section1 = db.query(Section).filter(Section.order_index == 1).first()
-                        if db_section1:
-                            section1_progress = db.query(SectionProgress).filter(
-                                SectionProgress.test_attempt_id == test_attempt.id,
-                                SectionProgress.section_id == db_section1.id
-                            ).first()
-                        else:
-                            section1_progress = None
-                    
-                    if section1_progress and section1_progress.status == SectionStatus.COMPLETED:
-                        section_status = "completed"
-                    elif current_section_index == 1:
-                        # Section 1 is current - available
-                        section_status = "available"
-                    else:
-                        # Section 1 should be available if not completed
-                        section_status = "available"
-            else:
-                # Sections 2-5: Apply locking rules based on current_section
-                if not test_attempt or current_section_index == 0 or current_section_index == 1:
-                    # No attempt or Section 1 is current - all sections 2-5 are locked
-                    section_status = "locked"
-                else:
-                    # Check progress for this section - handle both DB and temp sections
-                    section_id = section.id if (hasattr(section, 'id') and isinstance(section.id, int) and section.id > 0) else None
-                    
-                    if section_id:
-                        # Real database section - query by ID
-                        progress = db.query(SectionProgress).filter(
-                            SectionProgress.test_attempt_id == test_attempt.id,
-                            SectionProgress.section_id == section_id
-                        ).first()
-                    else:
-                        # Temp section - find by order_index
-                        db_section = db.query(Section).filter(Section.order_index == section.order_index).first()
-                        if db_section:
-                            progress = db.query(SectionProgress).filter(
-                                SectionProgress.test_attempt_id == test_attempt.id,
-                                SectionProgress.section_id == db_section.id
-                            ).first()
-                        else:
-                            progress = None
-                    
-                    if section.order_index < current_section_index:
-                        # Section is before current - should be completed
-                        section_status = "completed"
-                    elif section.order_index == current_section_index:
-                        # This is the current section
-                        if progress and progress.status == SectionStatus.COMPLETED:
-                            section_status = "completed"
-                        else:
-                            section_status = "available"
-                    else:
-                        # Section is after current - check if previous sections are completed
-                        prev_sections_completed = True
-                        for prev_section in all_sections:
-                            if prev_section.order_index < section.order_index:
-                                prev_section_id = prev_section.id if (hasattr(prev_section, 'id') and isinstance(prev_section.id, int) and prev_section.id > 0) else None
-                                
-                                if prev_section_id:
-                                    prev_progress = db.query(SectionProgress).filter(
-                                        SectionProgress.test_attempt_id == test_attempt.id,
-                                        SectionProgress.section_id == prev_section_id,
-                                        SectionProgress.status == SectionStatus.COMPLETED
-                                    ).first()
-                                else:
-                                    # Temp section - find by order_index
-                                    db_prev_section = db.query(Section).filter(Section.order_index == prev_section.order_index).first()
-                                    if db_prev_section:
-                                        prev_progress = db.query(SectionProgress).filter(
-                                            SectionProgress.test_attempt_id == test_attempt.id,
-                                            SectionProgress.section_id == db_prev_section.id,
-                                            SectionProgress.status == SectionStatus.COMPLETED
-                                        ).first()
-                                    else:
-                                        prev_progress = None
-                                
-                                if not prev_progress:
-                                    prev_sections_completed = False
-                                    break
-                        
-                        if prev_sections_completed:
-                            section_status = "available"
-                        else:
-                            section_status = "locked"
+            section_status = section_list_status(section.order_index, current_section_index, completed_orders)
             
-            # Question count - default to 7, don't query if section not in DB
+            # Question count - default to QUESTIONS_PER_SECTION when the section has no active questions
             # Question availability is checked ONLY when section starts, not while listing
-            question_count = QUESTIONS_PER_SECTION  # Fixed: QUESTIONS_PER_SECTION questions per section
-            
-            # Only query question count if section exists in database (has real ID from DB)
-            if hasattr(section, 'id') and isinstance(section.id, int) and section.id > 0:
-                try:
-                    # Check if this is a real database section (not a temp object)
-                    db_section_check = db.query(Section).filter(Section.id == section.id).first()
-                    if db_section_check:
-                        actual_count = db.query(Question).filter(
-                            Question.section_id == section.id,
-                            Question.is_active == True
-                        ).count()
-                        # Use actual count if available, but default to 10 if 0
-                        if actual_count > 0:
-                            question_count = actual_count
-                except:
-                    # If query fails, use default 10
-                    pass
+            question_count = question_counts.get(section.id, QUESTIONS_PER_SECTION)
             
             # Use section.id if it's a real database section, otherwise use order_index
             section_id = section.id if (hasattr(section, 'id') and isinstance(section.id, int) and section.id > 0) else section.order_index
             
-            sections_result.append(SectionMetadataResponse(
-                id=section_id,
-                name=section.name,
-                status=section_status,
-                question_count=question_count,
-                time_limit=420,  # Fixed: 7 minutes per section
-                order_index=section.order_index
-            ))
-            print(f"  ✅ Added section {section.order_index} to result")
+            sections_result.append({
+                "id": section_id,
+                "name": section.name,
+                "status": section_status,
+                "question_count": question_count,
+                "time_limit": SECTION_TIME_LIMIT,  # Fixed: 7 minutes per section
+                "order_index": section.order_index
+            })
         except Exception as e:
-            print(f"  ❌ ERROR processing section {section.order_index}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error processing section %s: %s", section.order_index, e)
     
-    # Debug: Ensure we always return exactly 5 sections
-    print(f"🔵 Final sections_result count: {len(sections_result)}")
+    # Ensure we always return exactly 5 sections
     if len(sections_result) != 5:
-        print(f"⚠️ WARNING: Expected 5 sections but got {len(sections_result)}")
-        print(f"   Sections order_index: {[s.order_index for s in sections_result]}")
-    else:
-        print(f"✅ Successfully returning all 5 sections")
+        logger.warning(
+            "Expected 5 sections but got %s (order_index: %s)",
+            len(sections_result), [s['order_index'] for s in sections_result]
+        )
     
-    response = SectionsListResponse(
-        current_section=current_section_index,
-        sections=sections_result,
-        can_attempt_test=can_attempt_test,
-        completed_test_attempt_id=completed_test_attempt_id
-    )
-    print(f"🔵 Response sections count: {len(response.sections)}")
-    print(f"🔵 Response can_attempt_test: {response.can_attempt_test}, completed_test_attempt_id: {response.completed_test_attempt_id}")
-    return response
+    # Payload is built from trusted values in the SectionsListResponse shape and serialized
+    # straight to orjson, skipping response-model validation and jsonable_encoder.
+    # Statuses change as the student advances, so clients must revalidate every time.
+    response = {
+        "current_section": current_section_index,
+        "sections": sections_result,
+        "can_attempt_test": can_attempt_test,
+        "completed_test_attempt_id": completed_test_attempt_id
+    }
+    body = orjson.dumps(response)
+    if completed_test_attempt_id is not None and test_attempt_id is None:
+        with _SECTIONS_DONE_LOCK:
+            _SECTIONS_DONE_CACHE[done_key] = body
+    return etag_body_response(request, body, "private, no-cache")
 
 
-@router.get("/sections/{section_id}/questions", response_model=List[QuestionResponse])
-async def get_section_questions(
+@router.get(
+    "/sections/{section_id}/questions",
+    response_model=None,
+    responses={200: {"model": List[QuestionResponse]}}
+)
+def get_section_questions(
+    request: Request,
     section_id: int,
     attempt_id: int,
     db: Session = Depends(get_db),
@@ -1214,11 +1380,7 @@ async def get_section_questions(
         )
     
     # Verify section exists - try by ID first, then by order_index (for sections 4-5 that might use order_index as ID)
-    section = db.query(Section).filter(Section.id == section_id).first()
-    if not section:
-        # Try finding by order_index if section_id matches an order_index (for temp sections)
-        if 1 <= section_id <= 5:
-            section = db.query(Section).filter(Section.order_index == section_id).first()
+    section = resolve_section(db, section_id)
     
     if not section:
         raise HTTPException(
@@ -1228,26 +1390,15 @@ async def get_section_questions(
     
     # Check if section is unlocked (previous sections must be completed)
     if section.order_index > 1:
-        previous_sections = db.query(Section).filter(
-            Section.order_index < section.order_index,
-            Section.is_active == True
-        ).order_by(Section.order_index).all()
-        
-        for prev_section in previous_sections:
-            prev_progress = db.query(SectionProgress).filter(
-                SectionProgress.test_attempt_id == attempt_id,
-                SectionProgress.section_id == prev_section.id,
-                SectionProgress.status == SectionStatus.COMPLETED
-            ).first()
-            
-            if not prev_progress:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Please complete {prev_section.name} first"
-                )
+        incomplete_section_name = first_incomplete_previous_section(db, attempt_id, section.order_index)
+        if incomplete_section_name is not None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Please complete {incomplete_section_name} first"
+            )
     
-    # Get questions for this section
-    questions = db.query(Question).filter(
+    # Get questions for this section (only the columns the response needs)
+    questions = db.query(Question.id, Question.question_text, Question.options).filter(
         Question.section_id == section_id,
         Question.is_active == True
     ).order_by(Question.order_index).all()
@@ -1259,18 +1410,12 @@ async def get_section_questions(
             detail=f"Section must have exactly {QUESTIONS_PER_SECTION} questions. Found {len(questions)} questions."
         )
     
-    return [
-        QuestionResponse(
-            question_id=q.id,
-            question_text=q.question_text,
-            options=parse_options_to_array(q.options)
-        )
-        for q in questions
-    ]
+    # Section questions only change when content is edited
+    return etag_json_response(request, question_payload(questions), "private, max-age=3600")
 
 
 @router.post("/sections/{section_id}/start", response_model=SectionProgressResponse)
-async def start_section(
+def start_section(
     section_id: int,
     attempt_id: int,
     db: Session = Depends(get_db),
@@ -1290,11 +1435,7 @@ async def start_section(
         )
     
     # Verify section exists - try by ID first, then by order_index (for sections 4-5 that might use order_index as ID)
-    section = db.query(Section).filter(Section.id == section_id).first()
-    if not section:
-        # Try finding by order_index if section_id matches an order_index (for temp sections)
-        if 1 <= section_id <= 5:
-            section = db.query(Section).filter(Section.order_index == section_id).first()
+    section, progress = resolve_section_with_progress(db, section_id, attempt_id)
     
     if not section:
         raise HTTPException(
@@ -1304,45 +1445,33 @@ async def start_section(
     
     # Check if section is unlocked (same logic as get_section_questions)
     if section.order_index > 1:
-        previous_sections = db.query(Section).filter(
-            Section.order_index < section.order_index,
-            Section.is_active == True
-        ).order_by(Section.order_index).all()
-        
-        for prev_section in previous_sections:
-            prev_progress = db.query(SectionProgress).filter(
-                SectionProgress.test_attempt_id == attempt_id,
-                SectionProgress.section_id == prev_section.id,
-                SectionProgress.status == SectionStatus.COMPLETED
-            ).first()
-            
-            if not prev_progress:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Please complete {prev_section.name} first"
-                )
+        incomplete_section_name = first_incomplete_previous_section(db, attempt_id, section.order_index)
+        if incomplete_section_name is not None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Please complete {incomplete_section_name} first"
+            )
     
-    # Get or create section progress
-    # CRITICAL: Use actual database section ID, not the parameter (which might be order_index)
-    progress = db.query(SectionProgress).filter(
-        SectionProgress.test_attempt_id == attempt_id,
-        SectionProgress.section_id == section.id  # Use actual database section ID
-    ).first()
+    # One timestamp for every field this request writes
+    now = datetime.now(timezone.utc)
     
+    # Get or create section progress (loaded above by actual database section ID,
+    # not the parameter, which might be order_index)
     if not progress:
         # Create new progress
         progress = SectionProgress(
             test_attempt_id=attempt_id,
             section_id=section.id,  # Use actual database section ID
             status=SectionStatus.IN_PROGRESS,
-            section_start_time=datetime.now(timezone.utc)
+            section_start_time=now,
+            total_time_spent=0
         )
         db.add(progress)
     else:
         # Resume if paused, or continue if already in progress
         if progress.status == SectionStatus.NOT_STARTED:
             progress.status = SectionStatus.IN_PROGRESS
-            progress.section_start_time = datetime.now(timezone.utc)
+            progress.section_start_time = now
         elif progress.status == SectionStatus.COMPLETED:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -1350,17 +1479,16 @@ async def start_section(
             )
         elif progress.paused_at:
             # Resume from pause
-            paused_duration = (datetime.now(timezone.utc) - progress.paused_at).total_seconds()
+            paused_duration = (now - progress.paused_at).total_seconds()
             progress.total_time_spent += int(paused_duration)
             progress.paused_at = None
             progress.status = SectionStatus.IN_PROGRESS
             if not progress.section_start_time:
-                progress.section_start_time = datetime.now(timezone.utc)
-    
-    db.commit()
-    db.refresh(progress)
+                progress.section_start_time = now
     
-    return SectionProgressResponse(
+    # Build the response from the values just written; reading them after commit
+    # would expire the objects and re-SELECT them
+    response = SectionProgressResponse(
         section_id=section.id,
         section_name=section.name,
         status=progress.status.value,
@@ -1368,10 +1496,15 @@ async def start_section(
         is_paused=progress.paused_at is not None,
         current_time=progress.total_time_spent
     )
+    section_db_id, order_index = section.id, section.order_index
+    db.commit()
+    forget_section_timer(attempt_id, section_db_id, order_index)
+    
+    return response
 
 
 @router.post("/sections/{section_id}/pause")
-async def pause_section(
+def pause_section(
     section_id: int,
     attempt_id: int,
     db: Session = Depends(get_db),
@@ -1380,9 +1513,7 @@ async def pause_section(
     try:
         """Pause section timer"""
         # First, find the section by ID or order_index
-        section = db.query(Section).filter(Section.id == section_id).first()
-        if not section and 1 <= section_id <= 5:
-            section = db.query(Section).filter(Section.order_index == section_id).first()
+        section, progress = resolve_section_with_progress(db, section_id, attempt_id)
         
         if not section:
             raise HTTPException(
@@ -1390,12 +1521,6 @@ async def pause_section(
                 detail=f"Section not found (ID: {section_id})"
             )
         
-        # Use actual database section ID to find progress
-        progress = db.query(SectionProgress).filter(
-            SectionProgress.test_attempt_id == attempt_id,
-            SectionProgress.section_id == section.id  # Use actual database section ID
-        ).first()
-        
         if not progress:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1408,26 +1533,30 @@ async def pause_section(
                 detail="Section is not running"
             )
         
+        now = datetime.now(timezone.utc)
+        
         # Calculate time spent since start
         if progress.section_start_time:
-            elapsed = (datetime.now(timezone.utc) - progress.section_start_time).total_seconds()
+            elapsed = (now - progress.section_start_time).total_seconds()
             progress.total_time_spent += int(elapsed)
             progress.section_start_time = None
         
-        progress.paused_at = datetime.now(timezone.utc)
+        progress.paused_at = now
+        total_time_spent = progress.total_time_spent
+        section_db_id, order_index = section.id, section.order_index
         db.commit()
+        forget_section_timer(attempt_id, section_db_id, order_index)
         
-        return {"message": "Section paused", "total_time_spent": progress.total_time_spent}
+        return {"message": "Section paused", "total_time_spent": total_time_spent}
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("pause_section failed for section %s, attempt %s", section_id, attempt_id)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/sections/{section_id}/resume")
-async def resume_section(
+def resume_section(
     section_id: int,
     attempt_id: int,
     db: Session = Depends(get_db),
@@ -1435,9 +1564,7 @@ async def resume_section(
 ):
     """Resume section timer"""
     # First, find the section by ID or order_index
-    section = db.query(Section).filter(Section.id == section_id).first()
-    if not section and 1 <= section_id <= 5:
-        section = db.query(Section).filter(Section.order_index == section_id).first()
+    section, progress = resolve_section_with_progress(db, section_id, attempt_id)
     
     if not section:
         raise HTTPException(
@@ -1445,106 +1572,130 @@ async def resume_section(
             detail=f"Section not found (ID: {section_id})"
         )
     
-    # Use actual database section ID to find progress
-    progress = db.query(SectionProgress).filter(
-        SectionProgress.test_attempt_id == attempt_id,
-        SectionProgress.section_id == section.id  # Use actual database section ID
-    ).first()
-    
     if not progress or not progress.paused_at:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Section is not paused"
         )
     
-    # Resume timer
-    progress.section_start_time = datetime.now(timezone.utc)
-    progress.paused_at = None
-    progress.status = SectionStatus.IN_PROGRESS
+    # Resume timer with one UPDATE; total_time_spent is unchanged, so read it before commit expires the row
+    total_time_spent = progress.total_time_spent
+    db.execute(
+        update(SectionProgress).where(SectionProgress.id == progress.id).values(
+            section_start_time=datetime.now(timezone.utc),
+            paused_at=None,
+            status=SectionStatus.IN_PROGRESS
+        )
+    )
+    section_db_id, order_index = section.id, section.order_index
     db.commit()
+    forget_section_timer(attempt_id, section_db_id, order_index)
     
-    return {"message": "Section resumed", "total_time_spent": progress.total_time_spent}
+    return {"message": "Section resumed", "total_time_spent": total_time_spent}
 
 
-@router.get("/sections/{section_id}/timer", response_model=SectionProgressResponse)
-async def get_section_timer(
+@router.get(
+    "/sections/{section_id}/timer",
+    response_model=None,
+    responses={200: {"model": SectionProgressResponse}}
+)
+def get_section_timer(
     section_id: int,
     attempt_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_student)
 ):
     """Get current timer status for a section (backend-driven)"""
+    # Polled about once a second per running section. Every field comes from the database
+    # or from arithmetic here, so the body is a plain dict in SectionProgressResponse's
+    # field order, serialized by orjson without a model validation pass.
+    timer_key = (attempt_id, section_id)
+    with _TIMER_LOCK:
+        cached = _TIMER_CACHE.get(timer_key)
+    if cached is not None:
+        fields, running_since = cached
+        current_time = fields["total_time_spent"]
+        if running_since is not None:
+            current_time += int((datetime.now(timezone.utc) - running_since).total_seconds())
+        # A section that has just run out of time falls through so the limit is written below
+        if running_since is None or current_time < SECTION_TIME_LIMIT:
+            return ORJSONResponse({**fields, "current_time": min(current_time, SECTION_TIME_LIMIT)})
+    
     # First, find the section by ID or order_index
-    # This is critical because section_id might be order_index for sections 4-5
-    section = db.query(Section).filter(Section.id == section_id).first()
-    if not section and 1 <= section_id <= 5:
-        section = db.query(Section).filter(Section.order_index == section_id).first()
+    # This is critical because section_id might be order_index for sections 4-5.
+    # Progress is always stored with the actual database section ID and comes back in the same query.
+    section, progress = resolve_section_with_progress(db, section_id, attempt_id)
     
     if not section:
-        print(f"⚠️ Timer: Section not found - section_id={section_id}, attempt_id={attempt_id}")
+        logger.debug("Timer: section not found - section_id=%s, attempt_id=%s", section_id, attempt_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Section not found (ID: {section_id})"
         )
     
-    print(f"🔵 Timer: Found section - id={section.id}, order_index={section.order_index}, name={section.name}")
-    
-    # Now use the actual database section ID to find progress
-    # Progress is always stored with the actual database section ID
-    progress = db.query(SectionProgress).filter(
-        SectionProgress.test_attempt_id == attempt_id,
-        SectionProgress.section_id == section.id  # Use actual database section ID
-    ).first()
+    logger.debug("Timer: found section - id=%s, order_index=%s, name=%s", section.id, section.order_index, section.name)
     
     if not progress:
-        print(f"⚠️ Timer: Progress not found - section_id={section.id} (db), order_index={section.order_index}, attempt_id={attempt_id}")
-        # If progress doesn't exist, return a default response (section not started yet)
-        return SectionProgressResponse(
-            section_id=section.id,
-            section_name=section.name,
-            status=SectionStatus.NOT_STARTED.value,
-            total_time_spent=0,
-            is_paused=False,
-            current_time=0
+        logger.debug(
+            "Timer: progress not found - section_id=%s (db), order_index=%s, attempt_id=%s",
+            section.id, section.order_index, attempt_id
         )
+        # If progress doesn't exist, return a default response (section not started yet)
+        return ORJSONResponse({
+            "section_id": section.id,
+            "section_name": section.name,
+            "status": SectionStatus.NOT_STARTED.value,
+            "total_time_spent": 0,
+            "is_paused": False,
+            "current_time": 0
+        })
     
     # Calculate current time if running
     # CRITICAL: Enforce 7-minute (420 seconds) limit per section
-    SECTION_TIME_LIMIT = 420  # 7 minutes in seconds
     
+    fields = {
+        "section_id": section.id,
+        "section_name": section.name,
+        "status": progress.status.value,
+        "total_time_spent": progress.total_time_spent,
+        "is_paused": progress.paused_at is not None
+    }
     current_time = progress.total_time_spent
-    if progress.section_start_time and not progress.paused_at:
-        if progress.section_start_time.tzinfo is None:
-            progress.section_start_time = progress.section_start_time.replace(tzinfo=timezone.utc)
+    section_start_time = progress.section_start_time
+    running_since = None
+    if section_start_time and not progress.paused_at:
+        if section_start_time.tzinfo is None:
+            section_start_time = section_start_time.replace(tzinfo=timezone.utc)
 
-        elapsed = (datetime.now(timezone.utc) - progress.section_start_time).total_seconds()
+        elapsed = (datetime.now(timezone.utc) - section_start_time).total_seconds()
         current_time = progress.total_time_spent + int(elapsed)
         
         # Enforce time limit - auto-complete if exceeded
         if current_time >= SECTION_TIME_LIMIT:
-            # Time limit exceeded, mark section as completed
-            progress.total_time_spent = SECTION_TIME_LIMIT
-            progress.section_start_time = None
-            progress.status = SectionStatus.COMPLETED
-            progress.paused_at = None
+            # Time limit exceeded, mark section as completed in one UPDATE
+            db.execute(
+                update(SectionProgress).where(SectionProgress.id == progress.id).values(
+                    total_time_spent=SECTION_TIME_LIMIT,
+                    section_start_time=None,
+                    status=SectionStatus.COMPLETED,
+                    paused_at=None
+                )
+            )
             db.commit()
-            current_time = SECTION_TIME_LIMIT
+            fields["status"] = SectionStatus.COMPLETED.value
+            fields["total_time_spent"] = SECTION_TIME_LIMIT
+        else:
+            running_since = section_start_time
     
-    # Cap current_time at limit
-    current_time = min(current_time, SECTION_TIME_LIMIT)
+    with _TIMER_LOCK:
+        _TIMER_CACHE[timer_key] = (fields, running_since)
     
-    return SectionProgressResponse(
-        section_id=section.id,
-        section_name=section.name,
-        status=progress.status.value,
-        total_time_spent=progress.total_time_spent,
-        is_paused=progress.paused_at is not None,
-        current_time=current_time
-    )
+    # Cap current_time at limit
+    return ORJSONResponse({**fields, "current_time": min(current_time, SECTION_TIME_LIMIT)})
 
 
 @router.post("/sections/{section_id}/submit", status_code=status.HTTP_200_OK)
-async def submit_section(
+def submit_section(
     section_id: int,
     submit_data: SubmitSectionRequest,
     db: Session = Depends(get_db),
@@ -1569,111 +1720,135 @@ async def submit_section(
             detail="Test attempt not found"
         )
     
-    # Verify section - try by ID first, then by order_index (for sections 4-5 that might use order_index as ID)
-    section = db.query(Section).filter(Section.id == section_id).first()
-    if not section:
-        # Try finding by order_index if section_id matches an order_index (for temp sections)
-        if 1 <= section_id <= 5:
-            section = db.query(Section).filter(Section.order_index == section_id).first()
+    # Verify section - try by ID first, then by order_index (for sections 4-5 that might use order_index as ID).
+    # The attempt's progress row and whether it already has answers for the section come back in the same row.
+    row = db.execute(
+        _SECTION_FOR_SUBMIT_STMT, {"sid": section_id, "aid": submit_data.attempt_id}
+    ).first()
     
-    if not section:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Section not found (ID: {section_id})"
         )
+    section, progress, existing_answers = row
     
-    # Get section questions - use actual database section ID
-    section_questions = db.query(Question).filter(
-        Question.section_id == section.id,  # Use actual database section ID
-        Question.is_active == True
-    ).order_by(Question.order_index).all()
+    # Get section question ids - use actual database section ID
+    section_question_ids = frozenset(db.execute(_SECTION_QUESTION_IDS_STMT, {"section_db_id": section.id}).scalars())
     
     # CRITICAL: Validate exactly QUESTIONS_PER_SECTION questions per section
-    if len(section_questions) != QUESTIONS_PER_SECTION:
+    if len(section_question_ids) != QUESTIONS_PER_SECTION:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Section must have exactly {QUESTIONS_PER_SECTION} questions. Found {len(section_questions)} questions."
+            detail=f"Section must have exactly {QUESTIONS_PER_SECTION} questions. Found {len(section_question_ids)} questions."
         )
     
-    if len(submit_data.answers) != len(section_questions):
+    if len(submit_data.answers) != len(section_question_ids):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Must answer all questions in section. Expected {len(section_questions)}, got {len(submit_data.answers)}"
+            detail=f"Must answer all questions in section. Expected {len(section_question_ids)}, got {len(submit_data.answers)}"
         )
     
-    # Check if section already submitted - use actual database section ID
-    progress = db.query(SectionProgress).filter(
-        SectionProgress.test_attempt_id == submit_data.attempt_id,
-        SectionProgress.section_id == section.id  # Use actual database section ID
-    ).first()
-    
+    # Check if section already submitted
     if progress and progress.status == SectionStatus.COMPLETED:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Section already submitted"
         )
     
-    # Check for duplicate answers for this section - use actual database section ID
-    existing_answers = db.query(Answer).join(Question).filter(
-        Answer.test_attempt_id == submit_data.attempt_id,
-        Question.section_id == section.id  # Use actual database section ID
-    ).count()
-    
-    if existing_answers > 0:
+    # Check for duplicate answers for this section
+    if existing_answers:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Answers already submitted for this section"
         )
     
-    # Save answers
-    question_map = {q.id: q for q in section_questions}
-    for answer_data in submit_data.answers:
-        if answer_data.question_id not in question_map:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Question {answer_data.question_id} does not belong to this section"
-            )
-        
-        answer = Answer(
-            test_attempt_id=submit_data.attempt_id,
-            question_id=answer_data.question_id,
-            answer_text=answer_data.selected_option
+    # Every answered question must belong to this section; one set difference checks them all
+    answered_ids = {answer_data.question_id for answer_data in submit_data.answers}
+    if len(answered_ids) != len(submit_data.answers):
+        # One answer per question (unique index on test_attempt_id, question_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Duplicate question_id in answers"
+        )
+    foreign_ids = answered_ids - section_question_ids
+    if foreign_ids:
+        # Report the first offending answer, in submission order
+        question_id = next(a.question_id for a in submit_data.answers if a.question_id in foreign_ids)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Question {question_id} does not belong to this section"
         )
-        db.add(answer)
-    
-    # CRITICAL: Enforce 7-minute (420 seconds) limit per section
-    SECTION_TIME_LIMIT = 420  # 7 minutes in seconds
     
-    # Update section progress - use actual database section ID
+    # Claim the section before writing answers: its progress row becomes COMPLETED in this
+    # transaction, and a concurrent submit of the same section either finds the insert
+    # conflicting or the status-guarded UPDATE matching nothing, so answers are saved once.
+    section_db_id = section.id
+    order_index = section.order_index
     if not progress:
-        progress = SectionProgress(
-            test_attempt_id=submit_data.attempt_id,
-            section_id=section.id,  # Use actual database section ID
-            status=SectionStatus.COMPLETED,
-            total_time_spent=0
+        result = db.execute(
+            insert_ignore(SectionProgress).values(
+                test_attempt_id=submit_data.attempt_id,
+                section_id=section_db_id,  # Use actual database section ID
+                status=SectionStatus.COMPLETED,
+                total_time_spent=0
+            )
         )
-        db.add(progress)
-        print(f"🔵 Created new progress for section {section.order_index} (ID: {section.id})")
-    else:
-        # Finalize timer
+        if result.rowcount:
+            progress_id = result.inserted_primary_key[0]
+            logger.debug("Created new progress for section %s (ID: %s)", order_index, section_db_id)
+        else:
+            # Another request created the progress row after it was read above
+            progress = db.query(SectionProgress).filter(
+                SectionProgress.test_attempt_id == submit_data.attempt_id,
+                SectionProgress.section_id == section_db_id
+            ).one()
+    
+    if progress:
+        # Finalize timer and cap time spent at the 7-minute limit, in one UPDATE that
+        # only applies while the section is still open
+        values = {"status": SectionStatus.COMPLETED, "paused_at": None}
+        total_time_spent = progress.total_time_spent
         if progress.section_start_time and not progress.paused_at:
             elapsed = (datetime.now(timezone.utc) - progress.section_start_time).total_seconds()
-            progress.total_time_spent += int(elapsed)
-            progress.section_start_time = None
-        
-        # Cap time spent at limit
-        progress.total_time_spent = min(progress.total_time_spent, SECTION_TIME_LIMIT)
-        progress.status = SectionStatus.COMPLETED
-        progress.paused_at = None
-        print(f"🔵 Updated progress for section {section.order_index} (ID: {section.id}) to COMPLETED")
+            total_time_spent += int(elapsed)
+            values["section_start_time"] = None
+        values["total_time_spent"] = min(total_time_spent, SECTION_TIME_LIMIT)
+        result = db.execute(
+            update(SectionProgress).where(
+                SectionProgress.id == progress.id,
+                SectionProgress.status != SectionStatus.COMPLETED
+            ).values(**values)
+        )
+        if result.rowcount == 0:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Section already submitted"
+            )
+        progress_id = progress.id
+        logger.debug("Updated progress for section %s (ID: %s) to COMPLETED", order_index, section_db_id)
+    
+    # Save answers in one multi-row INSERT, only once every answer has been validated
+    db.execute(insert(Answer), [
+        {
+            "test_attempt_id": submit_data.attempt_id,
+            "question_id": answer_data.question_id,
+            "answer_text": answer_data.selected_option
+        }
+        for answer_data in submit_data.answers
+    ])
     
     db.commit()
-    db.refresh(progress)
-    print(f"✅ Section {section.order_index} marked as COMPLETED (progress ID: {progress.id}, section_id: {progress.section_id})")
+    forget_section_timer(submit_data.attempt_id, section_db_id, order_index)
+    logger.debug(
+        "Section %s marked as COMPLETED (progress ID: %s, section_id: %s)",
+        order_index, progress_id, section_db_id
+    )
     
     return {
         "message": "Section submitted successfully",
         "section_id": section_id,
-        "next_section_available": section.order_index < db.query(Section).filter(Section.is_active == True).count()
+        "next_section_available": order_index < get_active_section_count(db)
     }
 
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends
-from models.user import User, UserRole
+from models import User, UserRole
 from auth.dependencies import require_role
 
 router = APIRouter(prefix="/test", tags=["test"])
@@ -10,35 +10,27 @@ require_counsellor = require_role([UserRole.COUNSELLOR])
 require_admin = require_role([UserRole.ADMIN])
 
 
-@router.get("/student")
-async def student_test(current_user: User = Depends(require_student)):
-    """Test route - Student access only"""
-    return {
-        "message": "Student access granted",
-        "user_id": current_user.id,
-        "user_email": current_user.email,
-        "user_role": current_user.role.value
-    }
-
-
-@router.get("/counsellor")
-async def counsellor_test(current_user: User = Depends(require_counsellor)):
-    """Test route - Counsellor access only"""
-    return {
-        "message": "Counsellor access granted",
-        "user_id": current_user.id,
-        "user_email": current_user.email,
-        "user_role": current_user.role.value
-    }
-
-
-@router.get("/admin")
-async def admin_test(current_user: User = Depends(require_admin)):
-    """Test route - Admin access only"""
-    return {
-        "message": "Admin access granted",
-        "user_id": current_user.id,
-        "user_email": current_user.email,
-        "user_role": current_user.role.value
-    }
+def _access_test_route(role_name: str, dependency):
+    """Build the access-check handler for one role; the message is fixed per role."""
+    message = f"{role_name.title()} access granted"
 
+    async def access_test(current_user: User = Depends(dependency)):
+        return {
+            "message": message,
+            "user_id": current_user.id,
+            "user_email": current_user.email,
+            "user_role": current_user.role.value
+        }
+
+    access_test.__name__ = f"{role_name}_test"
+    access_test.__doc__ = f"Test route - {role_name.title()} access only"
+    return access_test
+
+
+# Test routes: /test/student, /test/counsellor, /test/admin
+for _role_name, _dependency in (
+    ("student", require_student),
+    ("counsellor", require_counsellor),
+    ("admin", require_admin),
+):
+    router.get(f"/{_role_name}")(_access_test_route(_role_name, _dependency))
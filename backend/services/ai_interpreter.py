@@ -1,12 +1,18 @@
-from sqlalchemy.orm import Session
-from typing import Dict, List, Optional
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session, selectinload
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 import json
 from models import Score, Career, InterpretedResult, TestAttempt
 from config import settings
+from database import SessionLocal
 
 
+@lru_cache(maxsize=1)
 def get_ai_client():
-    """Get AI client based on configuration"""
+    """Get AI client based on configuration (built once, so its HTTP connection pool is reused)"""
     try:
         import openai
         client = openai.OpenAI(
@@ -18,6 +24,18 @@ def get_ai_client():
         raise ImportError("OpenAI library not installed. Install with: pip install openai")
 
 
+def _dimension_label(dimension: str) -> str:
+    return dimension.replace("_", " ").title()
+
+
+# Display labels for the dimensions calculate_raw_scores produces; question
+# categories used as dimensions fall back to _dimension_label
+_DIMENSION_LABEL = {
+    dimension: _dimension_label(dimension)
+    for dimension in ("overall", "general", *(f"section_{i}" for i in range(1, 6)))
+}
+
+
 def format_scores_for_ai(scores: List[Score]) -> str:
     """
     Format scores for AI interpretation without exposing raw values.
@@ -26,25 +44,26 @@ def format_scores_for_ai(scores: List[Score]) -> str:
     if not scores:
         return "No assessment scores available."
     
+    # Keyed on the score contents (in load order, which breaks sort ties), so a
+    # regenerated interpretation for unchanged scores reuses the text
+    return _format_scores_text(tuple((s.dimension, s.score_value) for s in scores))
+
+
+@lru_cache(maxsize=256)
+def _format_scores_text(scores: Tuple[Tuple[str, float], ...]) -> str:
     # Sort by score value to identify relative strengths
-    sorted_scores = sorted(scores, key=lambda x: x.score_value, reverse=True)
+    dimensions = [
+        _DIMENSION_LABEL.get(dimension) or _dimension_label(dimension)
+        for dimension, _ in sorted(scores, key=itemgetter(1), reverse=True)
+    ]
     
-    # Categorize into relative strengths
-    top_third = len(sorted_scores) // 3
+    # Categorize into relative strengths by slicing the sorted list into thirds
+    top_third = len(dimensions) // 3
     middle_third = top_third * 2
     
-    strengths = []
-    moderate = []
-    developing = []
-    
-    for idx, score in enumerate(sorted_scores):
-        dimension = score.dimension.replace("_", " ").title()
-        if idx < top_third:
-            strengths.append(dimension)
-        elif idx < middle_third:
-            moderate.append(dimension)
-        else:
-            developing.append(dimension)
+    strengths = dimensions[:top_third]
+    moderate = dimensions[top_third:middle_third]
+    developing = dimensions[middle_third:]
     
     description = "Assessment Results:\n"
     if strengths:
@@ -62,17 +81,24 @@ def format_careers_for_ai(careers: List[Career]) -> str:
     if not careers:
         return "No career recommendations available."
     
+    # Careers arrive ordered by order_index (relationship order_by / query ORDER BY)
+    return _format_careers_text(tuple(
+        (c.career_name, c.category, c.description, c.match_score) for c in careers
+    ))
+
+
+@lru_cache(maxsize=256)
+def _format_careers_text(careers: Tuple[Tuple[str, Optional[str], Optional[str], Optional[float]], ...]) -> str:
     career_list = []
-    for career in sorted(careers, key=lambda x: x.order_index):
-        match_desc = "high match" if career.match_score and career.match_score >= 70 else "moderate match" if career.match_score and career.match_score >= 50 else "exploratory option"
-        career_list.append(f"- {career.career_name} ({career.category}): {career.description} - {match_desc}")
+    for career_name, category, description, match_score in careers:
+        match_desc = "high match" if match_score and match_score >= 70 else "moderate match" if match_score and match_score >= 50 else "exploratory option"
+        career_list.append(f"- {career_name} ({category}): {description} - {match_desc}")
     
     return "Career Recommendations:\n" + "\n".join(career_list)
 
 
-def generate_interpretation_prompt(scores_text: str, careers_text: str) -> str:
-    """Generate prompt for AI interpretation"""
-    return f"""You are a career guidance assistant helping to interpret psychometric assessment results. Your role is to provide supportive, encouraging explanations and actionable guidance.
+# Static parts of the interpretation prompt; only the scores and careers text vary per call
+_PROMPT_PREFIX = """You are a career guidance assistant helping to interpret psychometric assessment results. Your role is to provide supportive, encouraging explanations and actionable guidance.
 
 IMPORTANT GUIDELINES:
 - You are an ASSISTANT only - careers have already been determined by the system
@@ -83,9 +109,9 @@ IMPORTANT GUIDELINES:
 - Provide practical, actionable advice
 
 ASSESSMENT DATA:
-{scores_text}
+"""
 
-{careers_text}
+_PROMPT_SUFFIX = """
 
 TASK:
 Generate a comprehensive interpretation that includes:
@@ -117,12 +143,102 @@ Generate a comprehensive interpretation that includes:
    - Focus on skill development, exploration, and preparation
 
 Format your response as JSON with these keys:
-{{
+{
   "interpretation_text": "Overall interpretation...",
   "strengths": "Bullet point 1\\nBullet point 2\\n...",
   "areas_for_improvement": "Opportunity 1\\nOpportunity 2\\n...",
   "action_plan": "0-6 months:\\n- Step 1\\n- Step 2\\n\\n6-12 months:\\n- Step 1\\n\\n12-24 months:\\n- Step 1"
-}}""".replace("{CAREERS_TEXT}", careers_text)
+}"""
+
+
+def generate_interpretation_prompt(scores_text: str, careers_text: str) -> str:
+    """Generate prompt for AI interpretation"""
+    return f"{_PROMPT_PREFIX}{scores_text}\n\n{careers_text}{_PROMPT_SUFFIX}"
+
+
+# Everything build_attempt_prompt reads from an attempt
+_INTERPRETATION_LOAD_OPTIONS = (
+    selectinload(TestAttempt.scores),
+    selectinload(TestAttempt.interpreted_result).selectinload(InterpretedResult.careers)
+)
+
+
+def load_attempt_for_interpretation(db: Session, test_attempt_id: int) -> Optional[TestAttempt]:
+    """Load a test attempt with its scores, interpreted result and careers in one pass"""
+    return db.query(TestAttempt).options(*_INTERPRETATION_LOAD_OPTIONS).filter(
+        TestAttempt.id == test_attempt_id
+    ).first()
+
+
+# Returned when no AI key is configured
+AI_NOT_CONFIGURED_INTERPRETATION = {
+    "interpretation_text": "Assessment completed. Please consult with a career counsellor for detailed interpretation.\n\nAction Plan:\n0-6 months: Review career recommendations\n6-12 months: Explore career options\n12-24 months: Take steps toward your chosen path",
+    "strengths": "Review your assessment results to identify your key strengths.",
+    "areas_for_improvement": "Consider areas where you'd like to grow and develop."
+}
+
+
+def interpretation_error_fallback(error: Exception) -> Dict:
+    return {
+        "interpretation_text": f"Assessment interpretation is being prepared. Error: {str(error)}",
+        "strengths": "Your assessment results show various strengths across different dimensions.",
+        "areas_for_improvement": "There are opportunities for growth in several areas."
+    }
+
+
+def build_attempt_prompt(test_attempt: TestAttempt) -> str:
+    """Build the AI prompt from an attempt loaded with _INTERPRETATION_LOAD_OPTIONS"""
+    scores = test_attempt.scores
+    if not scores:
+        raise ValueError("No scores found for test attempt")
+    
+    interpreted_result = test_attempt.interpreted_result
+    careers = interpreted_result.careers if interpreted_result else []
+    
+    # Format data for AI
+    scores_text = format_scores_for_ai(scores)
+    careers_text = format_careers_for_ai(careers)
+    
+    return generate_interpretation_prompt(scores_text, careers_text)
+
+
+def request_ai_interpretation(prompt: str) -> Dict:
+    """Send one prompt to the AI model and parse its reply into interpretation data"""
+    client = get_ai_client()
+    response = client.chat.completions.create(
+        model=settings.AI_MODEL,
+        messages=[
+            {
+                "role": "system",
+                "content": "You are a supportive career guidance assistant. Provide encouraging, practical guidance without using diagnostic or clinical language."
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        temperature=0.7,
+        max_tokens=2000
+    )
+    
+    # Parse response
+    ai_content = response.choices[0].message.content.strip()
+    
+    # Try to parse as JSON, fallback to plain text
+    try:
+        interpretation_data = json.loads(ai_content)
+        # Include action plan in interpretation text
+        if "action_plan" in interpretation_data:
+            interpretation_data["interpretation_text"] += "\n\n" + interpretation_data["action_plan"]
+    except json.JSONDecodeError:
+        # If not JSON, create structured response from text
+        interpretation_data = {
+            "interpretation_text": ai_content,
+            "strengths": "Review your assessment results to identify your key strengths.",
+            "areas_for_improvement": "Consider areas where you'd like to grow and develop."
+        }
+    
+    return interpretation_data
 
 
 def generate_ai_interpretation(db: Session, test_attempt_id: int) -> Dict:
@@ -132,118 +248,156 @@ def generate_ai_interpretation(db: Session, test_attempt_id: int) -> Dict:
     """
     if not settings.AI_API_KEY:
         # Fallback interpretation if AI is not configured
-        return {
-            "interpretation_text": "Assessment completed. Please consult with a career counsellor for detailed interpretation.\n\nAction Plan:\n0-6 months: Review career recommendations\n6-12 months: Explore career options\n12-24 months: Take steps toward your chosen path",
-            "strengths": "Review your assessment results to identify your key strengths.",
-            "areas_for_improvement": "Consider areas where you'd like to grow and develop."
-        }
+        return dict(AI_NOT_CONFIGURED_INTERPRETATION)
     
     try:
-        # Get test attempt
-        test_attempt = db.query(TestAttempt).filter(TestAttempt.id == test_attempt_id).first()
+        # Get test attempt with scores and career recommendations
+        test_attempt = load_attempt_for_interpretation(db, test_attempt_id)
         if not test_attempt:
             raise ValueError("Test attempt not found")
         
-        # Get scores
-        scores = db.query(Score).filter(Score.test_attempt_id == test_attempt_id).all()
-        if not scores:
-            raise ValueError("No scores found for test attempt")
-        
-        # Get career recommendations
-        interpreted_result = db.query(InterpretedResult).filter(
-            InterpretedResult.test_attempt_id == test_attempt_id
-        ).first()
-        
-        careers = []
-        if interpreted_result:
-            careers = db.query(Career).filter(
-                Career.interpreted_result_id == interpreted_result.id
-            ).order_by(Career.order_index).all()
-        
-        # Format data for AI
-        scores_text = format_scores_for_ai(scores)
-        careers_text = format_careers_for_ai(careers)
-        
-        # Generate prompt
-        prompt = generate_interpretation_prompt(scores_text, careers_text)
-        
-        # Call AI
-        client = get_ai_client()
-        response = client.chat.completions.create(
-            model=settings.AI_MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a supportive career guidance assistant. Provide encouraging, practical guidance without using diagnostic or clinical language."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.7,
-            max_tokens=2000
-        )
-        
-        # Parse response
-        ai_content = response.choices[0].message.content.strip()
-        
-        # Try to parse as JSON, fallback to plain text
-        try:
-            interpretation_data = json.loads(ai_content)
-            # Include action plan in interpretation text
-            if "action_plan" in interpretation_data:
-                interpretation_data["interpretation_text"] += "\n\n" + interpretation_data["action_plan"]
-        except json.JSONDecodeError:
-            # If not JSON, create structured response from text
-            interpretation_data = {
-                "interpretation_text": ai_content,
-                "strengths": "Review your assessment results to identify your key strengths.",
-                "areas_for_improvement": "Consider areas where you'd like to grow and develop."
-            }
-        
-        return interpretation_data
+        return request_ai_interpretation(build_attempt_prompt(test_attempt))
         
     except Exception as e:
         # Fallback on error
-        return {
-            "interpretation_text": f"Assessment interpretation is being prepared. Error: {str(e)}",
-            "strengths": "Your assessment results show various strengths across different dimensions.",
-            "areas_for_improvement": "There are opportunities for growth in several areas."
-        }
+        return interpretation_error_fallback(e)
 
 
 def store_ai_interpretation(db: Session, test_attempt_id: int) -> InterpretedResult:
     """
     Generate and store AI interpretation for test results.
-    Returns the InterpretedResult object.
+    Returns the InterpretedResult object, detached from any session.
+    
+    The caller's session is left untouched: the attempt is read and the result written
+    in short-lived sessions of their own, so no pooled connection is held while the AI
+    request is in flight.
     """
     # Generate interpretation
-    interpretation_data = generate_ai_interpretation(db, test_attempt_id)
-    
-    # Get or create interpreted result
-    interpreted_result = db.query(InterpretedResult).filter(
-        InterpretedResult.test_attempt_id == test_attempt_id
-    ).first()
-    
-    if not interpreted_result:
-        interpreted_result = InterpretedResult(
-            test_attempt_id=test_attempt_id,
-            interpretation_text=interpretation_data.get("interpretation_text", ""),
-            strengths=interpretation_data.get("strengths"),
-            areas_for_improvement=interpretation_data.get("areas_for_improvement"),
-            is_ai_generated=True
-        )
-        db.add(interpreted_result)
+    if not settings.AI_API_KEY:
+        interpretation_data = dict(AI_NOT_CONFIGURED_INTERPRETATION)
     else:
-        # Update existing interpretation
-        interpreted_result.interpretation_text = interpretation_data.get("interpretation_text", interpreted_result.interpretation_text)
-        interpreted_result.strengths = interpretation_data.get("strengths", interpreted_result.strengths)
-        interpreted_result.areas_for_improvement = interpretation_data.get("areas_for_improvement", interpreted_result.areas_for_improvement)
-        interpreted_result.is_ai_generated = True
+        try:
+            read_db = SessionLocal()
+            try:
+                test_attempt = load_attempt_for_interpretation(read_db, test_attempt_id)
+                if not test_attempt:
+                    raise ValueError("Test attempt not found")
+                prompt = build_attempt_prompt(test_attempt)
+            finally:
+                read_db.close()
+            
+            interpretation_data = request_ai_interpretation(prompt)
+        except Exception as e:
+            interpretation_data = interpretation_error_fallback(e)
     
-    db.commit()
-    db.refresh(interpreted_result)
+    write_db = SessionLocal()
+    try:
+        # Get or create interpreted result
+        test_attempt = write_db.get(
+            TestAttempt, test_attempt_id,
+            options=[selectinload(TestAttempt.interpreted_result)]
+        )
+        interpreted_result = test_attempt.interpreted_result if test_attempt else None
+        
+        if not interpreted_result:
+            interpreted_result = InterpretedResult(
+                test_attempt_id=test_attempt_id,
+                interpretation_text=interpretation_data.get("interpretation_text", ""),
+                strengths=interpretation_data.get("strengths"),
+                areas_for_improvement=interpretation_data.get("areas_for_improvement"),
+                is_ai_generated=True
+            )
+            write_db.add(interpreted_result)
+        else:
+            # Update existing interpretation
+            interpreted_result.interpretation_text = interpretation_data.get("interpretation_text", interpreted_result.interpretation_text)
+            interpreted_result.strengths = interpretation_data.get("strengths", interpreted_result.strengths)
+            interpreted_result.areas_for_improvement = interpretation_data.get("areas_for_improvement", interpreted_result.areas_for_improvement)
+            interpreted_result.is_ai_generated = True
+        
+        write_db.commit()
+        write_db.refresh(interpreted_result)
+    finally:
+        write_db.close()
     
     return interpreted_result
 
+
+def store_ai_interpretations_bulk(db: Session, test_attempt_ids: List[int], max_workers: int = 8) -> int:
+    """
+    Generate and store AI interpretations for many test attempts (e.g. a cohort).
+    Attempts are loaded in one query, the AI requests run concurrently, and the
+    results are written with one bulk INSERT and one bulk UPDATE.
+    Attempt ids that don't exist are skipped. Returns the number stored.
+    
+    Like store_ai_interpretation, the caller's session is left untouched; reads and
+    writes use their own sessions so no connection is held during the AI requests.
+    """
+    prompts = {}
+    results = {}
+    read_db = SessionLocal()
+    try:
+        attempts = read_db.query(TestAttempt).options(*_INTERPRETATION_LOAD_OPTIONS).filter(
+            TestAttempt.id.in_(test_attempt_ids)
+        ).all()
+        if not attempts:
+            return 0
+        
+        # attempt id -> existing InterpretedResult id (or None)
+        existing = {
+            attempt.id: attempt.interpreted_result.id if attempt.interpreted_result else None
+            for attempt in attempts
+        }
+        
+        if settings.AI_API_KEY:
+            for attempt in attempts:
+                try:
+                    prompts[attempt.id] = build_attempt_prompt(attempt)
+                except Exception as e:
+                    results[attempt.id] = interpretation_error_fallback(e)
+    finally:
+        read_db.close()
+    
+    if not settings.AI_API_KEY:
+        results = {attempt_id: dict(AI_NOT_CONFIGURED_INTERPRETATION) for attempt_id in existing}
+    else:
+        def request(prompt: str) -> Dict:
+            try:
+                return request_ai_interpretation(prompt)
+            except Exception as e:
+                return interpretation_error_fallback(e)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results.update(zip(prompts, executor.map(request, prompts.values())))
+    
+    inserts = []
+    updates = []
+    for attempt_id, interpretation_data in results.items():
+        if existing[attempt_id] is None:
+            inserts.append({
+                "test_attempt_id": attempt_id,
+                "interpretation_text": interpretation_data.get("interpretation_text", ""),
+                "strengths": interpretation_data.get("strengths"),
+                "areas_for_improvement": interpretation_data.get("areas_for_improvement"),
+                "is_ai_generated": True
+            })
+        else:
+            # Same as store_ai_interpretation: fields missing from the reply keep their stored value
+            row = {
+                key: interpretation_data[key]
+                for key in ("interpretation_text", "strengths", "areas_for_improvement")
+                if key in interpretation_data
+            }
+            updates.append({"id": existing[attempt_id], "is_ai_generated": True, **row})
+    
+    write_db = SessionLocal()
+    try:
+        if inserts:
+            write_db.execute(insert(InterpretedResult), inserts)
+        if updates:
+            write_db.execute(update(InterpretedResult), updates)
+        write_db.commit()
+    finally:
+        write_db.close()
+    
+    return len(results)
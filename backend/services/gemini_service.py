@@ -1,28 +1,100 @@
 import os
+import threading
 from typing import Dict, Optional, Tuple
-import json
+from cachetools import TTLCache
+import orjson
+
+
+try:
+    import google.generativeai as genai
+except ImportError:
+    genai = None
+
+# Client built on first use and shared by every request. Failures that can't change while
+# the process runs (SDK missing, key unset) are remembered too; other init errors are retried.
+_GEMINI_CLIENT: Optional[Tuple[Optional[object], Optional[str]]] = None
+_GEMINI_CLIENT_LOCK = threading.Lock()
 
 
 def get_gemini_client():
     """Get Gemini client using API key from environment variable"""
+    global _GEMINI_CLIENT
+    client = _GEMINI_CLIENT
+    if client is not None:
+        return client
+    
+    with _GEMINI_CLIENT_LOCK:
+        if _GEMINI_CLIENT is None:
+            model, error, permanent = _create_gemini_client()
+            if not permanent:
+                return model, error
+            _GEMINI_CLIENT = (model, error)
+        return _GEMINI_CLIENT
+
+
+def _create_gemini_client():
+    """Returns (model, error, permanent): permanent results are safe to reuse for the process lifetime"""
+    if genai is None:
+        return None, "Google Generative AI SDK not installed. Install with: pip install google-generativeai", True
+    
+    api_key = os.getenv("GEMINI_API_KEY", "").strip()
+    if not api_key:
+        return None, "GEMINI_API_KEY environment variable is not set", True
+    
     try:
-        import google.generativeai as genai
-        
-        api_key = os.getenv("GEMINI_API_KEY", "").strip()
-        if not api_key:
-            return None, "GEMINI_API_KEY environment variable is not set"
-        
         genai.configure(api_key=api_key)
         model = genai.GenerativeModel('gemini-pro')
-        return model, None
-    except ImportError:
-        return None, "Google Generative AI SDK not installed. Install with: pip install google-generativeai"
+        return model, None, True
     except Exception as e:
         error_msg = str(e)
         # Sanitize error message to avoid exposing secrets
         if "API key" in error_msg.lower() or "authentication" in error_msg.lower():
             error_msg = "Gemini API authentication failed"
-        return None, f"Gemini client initialization error: {error_msg}"
+        return None, f"Gemini client initialization error: {error_msg}", False
+
+
+# Static parts of the interpretation prompt; only the assessment results between them vary
+_PROMPT_PREFIX = """You are a career guidance AI. Provide guidance only. No medical or psychological diagnosis.
+
+ASSESSMENT RESULTS:
+"""
+
+_PROMPT_SUFFIX = """
+
+TASK:
+Generate a structured JSON response with the following exact structure:
+
+{
+  "summary": "A 2-3 sentence overview of the assessment results focusing on career readiness",
+  "strengths": ["strength 1", "strength 2", "strength 3"],
+  "weaknesses": ["area for improvement 1", "area for improvement 2"],
+  "career_clusters": ["cluster 1", "cluster 2", "cluster 3"],
+  "risk_level": "LOW" or "MEDIUM" or "HIGH",
+  "readiness_status": "READY" or "PARTIALLY READY" or "NOT READY",
+  "action_plan": [
+    "Step 1 for next 6 months",
+    "Step 2 for 6-12 months",
+    "Step 3 for 12-24 months"
+  ]
+}
+
+IMPORTANT:
+- Return ONLY valid JSON, no markdown, no code blocks
+- risk_level should be LOW if percentage >= 70, MEDIUM if 50-69, HIGH if < 50
+- readiness_status should align with readiness_band
+- Use positive, encouraging language throughout
+- Focus on career development, not diagnosis
+
+Return the JSON now:"""
+
+
+REQUIRED_FIELDS = ("summary", "strengths", "weaknesses", "career_clusters",
+                   "risk_level", "readiness_status", "action_plan")
+
+# Raw JSON of validated responses, keyed by the prompt inputs (percentage rounded to 0.1).
+# Identical results on retries/refreshes reuse the answer instead of calling Gemini again.
+_RESPONSE_CACHE = TTLCache(maxsize=512, ttl=3600)
+_RESPONSE_CACHE_LOCK = threading.Lock()
 
 
 def generate_interpretation(context: Dict) -> Tuple[Optional[Dict], Optional[str]]:
@@ -56,71 +128,48 @@ def generate_interpretation(context: Dict) -> Tuple[Optional[Dict], Optional[str
     readiness_band = context.get("readiness_band", "Medium")
     category_scores = context.get("category_scores")
     
+    cache_key = (
+        total_questions,
+        correct_answers,
+        round(percentage, 1),
+        readiness_band,
+        tuple(sorted(category_scores.items())) if category_scores else ()
+    )
+    with _RESPONSE_CACHE_LOCK:
+        cached = _RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        # Parsed per call: callers add their own keys to the returned dict
+        return orjson.loads(cached), None
+    
     category_info = ""
     if category_scores:
-        category_info = "\nCategory Breakdown:\n"
-        for cat, score in category_scores.items():
-            category_info += f"- {cat}: {score}%\n"
+        category_info = "\nCategory Breakdown:\n" + "".join(f"- {cat}: {score}%\n" for cat, score in category_scores.items())
     
-    prompt = f"""You are a career guidance AI. Provide guidance only. No medical or psychological diagnosis.
-
-ASSESSMENT RESULTS:
-- Total Questions: {total_questions}
-- Correct Answers: {correct_answers}
-- Percentage Score: {percentage}%
-- Readiness Band: {readiness_band}
-{category_info}
-
-TASK:
-Generate a structured JSON response with the following exact structure:
-
-{{
-  "summary": "A 2-3 sentence overview of the assessment results focusing on career readiness",
-  "strengths": ["strength 1", "strength 2", "strength 3"],
-  "weaknesses": ["area for improvement 1", "area for improvement 2"],
-  "career_clusters": ["cluster 1", "cluster 2", "cluster 3"],
-  "risk_level": "LOW" or "MEDIUM" or "HIGH",
-  "readiness_status": "READY" or "PARTIALLY READY" or "NOT READY",
-  "action_plan": [
-    "Step 1 for next 6 months",
-    "Step 2 for 6-12 months",
-    "Step 3 for 12-24 months"
-  ]
-}}
-
-IMPORTANT:
-- Return ONLY valid JSON, no markdown, no code blocks
-- risk_level should be LOW if percentage >= 70, MEDIUM if 50-69, HIGH if < 50
-- readiness_status should align with readiness_band
-- Use positive, encouraging language throughout
-- Focus on career development, not diagnosis
-
-Return the JSON now:"""
+    prompt = (
+        f"{_PROMPT_PREFIX}"
+        f"- Total Questions: {total_questions}\n"
+        f"- Correct Answers: {correct_answers}\n"
+        f"- Percentage Score: {percentage}%\n"
+        f"- Readiness Band: {readiness_band}\n"
+        f"{category_info}{_PROMPT_SUFFIX}"
+    )
     
     try:
         response = model.generate_content(prompt)
-        response_text = response.text.strip()
-        
         # Remove markdown code blocks if present
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
-        response_text = response_text.strip()
+        response_text = response.text.strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
         
-        interpretation = json.loads(response_text)
+        interpretation = orjson.loads(response_text)
         
         # Validate required fields
-        required_fields = ["summary", "strengths", "weaknesses", "career_clusters", 
-                          "risk_level", "readiness_status", "action_plan"]
-        for field in required_fields:
+        for field in REQUIRED_FIELDS:
             if field not in interpretation:
                 return None, f"Gemini response missing required field: {field}"
         
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[cache_key] = response_text
         return interpretation, None
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         return None, f"Failed to parse Gemini JSON response: {str(e)}"
     except Exception as e:
         error_msg = str(e)
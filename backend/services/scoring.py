@@ -1,8 +1,11 @@
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
 from typing import List, Dict
+import logging
 from models import Answer, Score, TestAttempt, Question, TestStatus
 
+logger = logging.getLogger(__name__)
+
 
 def calculate_raw_scores(db: Session, test_attempt_id: int) -> List[Dict]:
     """
@@ -55,7 +58,7 @@ def calculate_raw_scores(db: Session, test_attempt_id: int) -> List[Dict]:
             if answer_text_upper in likert_map:
                 value = float(likert_map[answer_text_upper])
             else:
-                print(f"⚠️ Invalid Likert answer '{answer.answer_text}' for question {question.id}, defaulting to 3 (C)")
+                logger.warning("Invalid Likert answer %r for question %s, defaulting to 3 (C)", answer.answer_text, question.id)
                 value = 3.0
         elif question.question_type.value == "MULTIPLE_CHOICE":
             if answer_text_upper in likert_map:
@@ -64,7 +67,7 @@ def calculate_raw_scores(db: Session, test_attempt_id: int) -> List[Dict]:
                 try:
                     value = float(answer.answer_text)
                 except (ValueError, TypeError):
-                    print(f"⚠️ Invalid MCQ answer '{answer.answer_text}' for question {question.id}, defaulting to 0")
+                    logger.warning("Invalid MCQ answer %r for question %s, defaulting to 0", answer.answer_text, question.id)
                     value = 0.0
         else:
             value = 0.0